@@ -7,7 +7,9 @@ containment is low.  A consecutive-frame requirement prevents spurious
 single-frame assignments from being reported as possession changes.
 """
 
-from utils.bbox_utils import measure_distance, get_center_of_bbox
+import math
+
+from utils.bbox_utils import measure_distance_sq, get_center_of_bbox
 
 
 class BallAquisitionDetector:
@@ -135,7 +137,8 @@ class BallAquisitionDetector:
         key_points = self.get_key_basketball_player_assignment_points(
             player_bbox, ball_center
         )
-        return min(measure_distance(ball_center, point) for point in key_points)
+        # Rank by squared distance and take a single square root at the end
+        return math.sqrt(min(measure_distance_sq(ball_center, point) for point in key_points))
 
     # ------------------------------------------------------------------
     # Per-frame candidate selection
@@ -1 +1 @@
-from .configs import STUBS_DEFAULT_PATH,PLAYER_DETECTOR_PATH,BALL_DETECTOR_PATH,COURT_KEYPOINT_DETECTOR_PATH,OUTPUT_VIDEO_PATH
\ No newline at end of file
+from .configs import STUBS_DEFAULT_PATH,PLAYER_DETECTOR_PATH,BALL_DETECTOR_PATH,COURT_KEYPOINT_DETECTOR_PATH,OUTPUT_VIDEO_PATH,DETECTOR_BATCH_SIZE,PLAYER_DETECTION_STRIDE,DETECTOR_INT8
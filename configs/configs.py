@@ -9,4 +9,16 @@ STUBS_DEFAULT_PATH = "stubs"
 PLAYER_DETECTOR_PATH = "models/player_detector.pt"
 BALL_DETECTOR_PATH = "models/ball_detector_model.pt"
 COURT_KEYPOINT_DETECTOR_PATH = "models/court_keypoint_detector.pt"
-OUTPUT_VIDEO_PATH = "output_videos/output_video.avi"
\ No newline at end of file
+OUTPUT_VIDEO_PATH = "output_videos/output_video.mp4"
+
+# Frames per predict() call for every detector; TensorRT engines are built
+# for at most this many images per batch, and changing it builds new ones.
+DETECTOR_BATCH_SIZE = 20
+
+# Run the player detector on every n-th frame only and interpolate the
+# frames in between (1 = detect every frame)
+PLAYER_DETECTION_STRIDE = 1
+
+# Build INT8 TensorRT engines, calibrated on frames of the input video,
+# instead of FP16 ones
+DETECTOR_INT8 = False
@@ -5,9 +5,9 @@ The model predicts 18 keypoints corresponding to known reference locations
 on a standard basketball court (corners, free-throw lines, centre line, etc.).
 """
 
-from ultralytics import YOLO
-
 from utils import read_stub, save_stub
+from utils.model_utils import load_yolo_model
+from configs import DETECTOR_BATCH_SIZE
 
 
 class CourtKeypointDetector:
@@ -16,8 +16,8 @@ class CourtKeypointDetector:
     It also provides functionality to draw these detected keypoints on the frames.
     """
 
-    def __init__(self, model_path):
-        self.model = YOLO(model_path)
+    def __init__(self, model_path, calibration_frames=None):
+        self.model = load_yolo_model(model_path, calibration_frames=calibration_frames)
 
     def get_court_keypoints(self, frames, read_from_stub=False, stub_path=None):
         """
@@ -38,10 +38,10 @@ class CourtKeypointDetector:
         if court_keypoints is not None and len(court_keypoints) == len(frames):
             return court_keypoints
 
-        batch_size = 20
+        batch_size = DETECTOR_BATCH_SIZE
         court_keypoints = []
         for i in range(0, len(frames), batch_size):
-            detections_batch = self.model.predict(frames[i : i + batch_size], conf=0.5)
+            detections_batch = self.model.predict(frames[i : i + batch_size], conf=0.5, half=True)
             for detection in detections_batch:
                 court_keypoints.append(detection.keypoints)
 
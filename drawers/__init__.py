@@ -6,6 +6,7 @@ from .frame_number_drawer import FrameNumberDrawer
 from .pass_and_interceptions_drawer import PassInterceptionDrawer
 from .tactical_view_drawer import TacticalViewDrawer
 from .shot_drawer import ShotDrawer
+from .composite_drawer import CompositeDrawer
 
 __all__ = [
     "PlayerTracksDrawer",
@@ -16,4 +17,5 @@ __all__ = [
     "PassInterceptionDrawer",
     "TacticalViewDrawer",
     "ShotDrawer",
+    "CompositeDrawer",
 ]
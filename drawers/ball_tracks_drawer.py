@@ -1,6 +1,6 @@
 """Draw ball-pointer triangles on each video frame."""
 
-from .utils import draw_traingle
+from .utils import ColorTable, draw_traingle
 
 
 class BallTracksDrawer:
@@ -9,6 +9,7 @@ class BallTracksDrawer:
 
     Attributes:
         ball_pointer_color (tuple): The color used to draw the ball pointers (in BGR format).
+        ball_pointer_colors (ColorTable): ``ball_pointer_color`` as a one-row color table.
     """
 
     def __init__(self):
@@ -16,29 +17,51 @@ class BallTracksDrawer:
         Initialize the BallTracksDrawer instance with default settings.
         """
         self.ball_pointer_color = (0, 255, 0)
+        self.ball_pointer_colors = ColorTable([self.ball_pointer_color])
+
+    def prepare(self, tracks):
+        """
+        Store the per-frame ball tracks consumed by ``draw_frame``.
+
+        Args:
+            tracks (list): A list of dictionaries where each dictionary contains ball information
+                for the corresponding frame.
+        """
+        self._tracks = tracks
 
     def draw(self, video_frames, tracks):
         """
         Draws ball pointers on each video frame based on provided tracking information.
 
         Args:
-            video_frames (list): A list of video frames (as NumPy arrays or image objects).
+            video_frames (iterable): Video frames (as NumPy arrays or image objects).
             tracks (list): A list of dictionaries where each dictionary contains ball information
                 for the corresponding frame.
 
-        Returns:
-            list: A list of processed video frames with drawn ball pointers.
+        Yields:
+            numpy.ndarray: Each processed video frame with drawn ball pointers.
         """
-        output_video_frames = []
+        self.prepare(tracks)
+
         for frame_num, frame in enumerate(video_frames):
-            frame = frame.copy()
-            ball_dict = tracks[frame_num]
+            yield self.draw_frame(frame.copy(), frame_num)
+
+    def draw_frame(self, frame, frame_num):
+        """
+        Draw the ball pointer on a single frame in place.
 
-            for _, ball in ball_dict.items():
-                if ball["bbox"] is None:
-                    continue
-                frame = draw_traingle(frame, ball["bbox"], self.ball_pointer_color)
+        Args:
+            frame (numpy.ndarray): The current video frame.
+            frame_num (int): The index of the current frame.
+
+        Returns:
+            numpy.ndarray: The annotated frame.
+        """
+        ball_dict = self._tracks[frame_num]
 
-            output_video_frames.append(frame)
+        for _, ball in ball_dict.items():
+            if ball["bbox"] is None:
+                continue
+            frame = draw_traingle(frame, ball["bbox"], 0, self.ball_pointer_colors)
 
-        return output_video_frames
+        return frame
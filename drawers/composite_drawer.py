@@ -0,0 +1,52 @@
+"""Apply several drawer layers to each frame in a single pass."""
+
+
+class CompositeDrawer:
+    """
+    Chain drawers so that every layer is rendered on a frame before moving on
+    to the next frame.
+
+    Each drawer must already have been ``prepare``-d with its per-frame data and
+    expose ``draw_frame(frame, frame_num)``.  Layers are applied in list order,
+    so later drawers paint over earlier ones.
+
+    Attributes:
+        drawers (list): The drawer layers, bottom first.
+    """
+
+    def __init__(self, drawers):
+        """
+        Initialize the CompositeDrawer with its layers.
+
+        Args:
+            drawers (list): Prepared drawer instances, bottom layer first.
+        """
+        self.drawers = list(drawers)
+
+    def draw(self, frames):
+        """
+        Lazily draw every layer on each frame.
+
+        Args:
+            frames (Iterable[numpy.ndarray]): Video frames, annotated in place.
+
+        Yields:
+            numpy.ndarray: Each fully annotated frame, in order.
+        """
+        for frame_num, frame in enumerate(frames):
+            yield self.draw_frame(frame, frame_num)
+
+    def draw_frame(self, frame, frame_num):
+        """
+        Draw every layer on a single frame.
+
+        Args:
+            frame (numpy.ndarray): The current video frame.
+            frame_num (int): The index of the current frame.
+
+        Returns:
+            numpy.ndarray: The annotated frame.
+        """
+        for drawer in self.drawers:
+            frame = drawer.draw_frame(frame, frame_num)
+        return frame
@@ -14,42 +14,60 @@ class CourtKeypointDrawer:
     def __init__(self):
         self.keypoint_color = "#ff2c2c"
 
-    def draw(self, frames, court_keypoints):
+    def prepare(self, court_keypoints):
         """
-        Draws court keypoints on a given list of frames.
+        Build the annotators and store the per-frame keypoints consumed by ``draw_frame``.
 
         Args:
-            frames (list): A list of frames (as NumPy arrays or image objects) on which to draw.
-            court_keypoints (list): A corresponding list of lists where each sub-list contains
+            court_keypoints (list): A list of lists where each sub-list contains
                 the (x, y) coordinates of court keypoints for that frame.
-
-        Returns:
-            list: A list of frames with keypoints drawn on them.
         """
-        vertex_annotator = sv.VertexAnnotator(
+        self._vertex_annotator = sv.VertexAnnotator(
             color=sv.Color.from_hex(self.keypoint_color), radius=8
         )
-        vertex_label_annotator = sv.VertexLabelAnnotator(
+        self._vertex_label_annotator = sv.VertexLabelAnnotator(
             color=sv.Color.from_hex(self.keypoint_color),
             text_color=sv.Color.WHITE,
             text_scale=0.5,
             text_thickness=1,
         )
+        self._court_keypoints = court_keypoints
+
+    def draw(self, frames, court_keypoints):
+        """
+        Draws court keypoints on a given list of frames.
+
+        Args:
+            frames (iterable): Frames (as NumPy arrays or image objects) on which to draw.
+            court_keypoints (list): A corresponding list of lists where each sub-list contains
+                the (x, y) coordinates of court keypoints for that frame.
+
+        Yields:
+            numpy.ndarray: Each frame with keypoints drawn on it.
+        """
+        self.prepare(court_keypoints)
 
-        output_frames = []
         for index, frame in enumerate(frames):
-            annotated_frame = frame.copy()
-            keypoints = court_keypoints[index]
+            yield self.draw_frame(frame.copy(), index)
 
-            annotated_frame = vertex_annotator.annotate(
-                scene=annotated_frame, key_points=keypoints
-            )
+    def draw_frame(self, frame, frame_num):
+        """
+        Draw the court keypoints of a single frame.
 
-            keypoints_numpy = keypoints.cpu().numpy()
-            annotated_frame = vertex_label_annotator.annotate(
-                scene=annotated_frame, key_points=keypoints_numpy
-            )
+        Args:
+            frame (numpy.ndarray): The current video frame.
+            frame_num (int): The index of the current frame.
 
-            output_frames.append(annotated_frame)
+        Returns:
+            numpy.ndarray: The annotated frame.
+        """
+        keypoints = self._court_keypoints[frame_num]
+
+        frame = self._vertex_annotator.annotate(scene=frame, key_points=keypoints)
+
+        keypoints_numpy = keypoints.cpu().numpy()
+        frame = self._vertex_label_annotator.annotate(
+            scene=frame, key_points=keypoints_numpy
+        )
 
-        return output_frames
+        return frame
@@ -1,8 +1,9 @@
 """Draw a semi-transparent overlay with cumulative pass and interception counts."""
 
-import cv2
 import numpy as np
 
+from .utils import TextBoxOverlay, running_total_at
+
 
 class PassInterceptionDrawer:
     """
@@ -11,7 +12,9 @@ class PassInterceptionDrawer:
     """
 
     def __init__(self):
-        pass
+        self.font_scale = 0.7
+        self.font_thickness = 2
+        self.alpha = 0.8
 
     # ------------------------------------------------------------------
     # Stats
@@ -29,11 +32,39 @@ class PassInterceptionDrawer:
             tuple: A tuple of four integers (team1_pass_total, team2_pass_total,
                 team1_interception_total, team2_interception_total).
         """
-        team1_passes = sum(1 for p in passes if p == 1)
-        team2_passes = sum(1 for p in passes if p == 2)
-        team1_interceptions = sum(1 for i in interceptions if i == 1)
-        team2_interceptions = sum(1 for i in interceptions if i == 2)
-        return team1_passes, team2_passes, team1_interceptions, team2_interceptions
+        pass_counts = self._count_team_events(passes)
+        interception_counts = self._count_team_events(interceptions)
+        return (
+            int(pass_counts[1]),
+            int(pass_counts[2]),
+            int(interception_counts[1]),
+            int(interception_counts[2]),
+        )
+
+    @staticmethod
+    def _count_team_events(events):
+        """Return ``[other, team1, team2]`` event counts in one vectorized pass."""
+        events = np.asarray(events, dtype=np.int64)
+        team_events = np.where((events == 1) | (events == 2), events, 0)
+        return np.bincount(team_events, minlength=3)
+
+    def prepare(self, passes, interceptions):
+        """
+        Precompute running pass and interception totals for every frame.
+
+        After this call ``draw_frame`` only has to index the cumulative arrays
+        instead of re-counting all events up to the current frame.
+
+        Args:
+            passes (list): A list of integers representing pass events at each frame.
+            interceptions (list): A list of integers representing interception events at each frame.
+        """
+        p = np.asarray(passes, dtype=np.int8)
+        i = np.asarray(interceptions, dtype=np.int8)
+        self._t1p = np.cumsum(p == 1)
+        self._t2p = np.cumsum(p == 2)
+        self._t1i = np.cumsum(i == 1)
+        self._t2i = np.cumsum(i == 2)
 
     # ------------------------------------------------------------------
     # Drawing
@@ -44,73 +75,68 @@ class PassInterceptionDrawer:
         Draw pass and interception statistics on a list of video frames.
 
         Args:
-            video_frames (list): A list of frames on which to draw.
+            video_frames (iterable): Frames on which to draw.
             passes (list): A list of integers representing pass events at each frame.
             interceptions (list): A list of integers representing interception events at each frame.
 
-        Returns:
-            list: A list of frames with pass and interception statistics drawn on them.
+        Yields:
+            numpy.ndarray: Each frame (after the first) with pass and interception statistics drawn on it.
         """
-        output_video_frames = []
+        self.prepare(passes, interceptions)
+
         for frame_num, frame in enumerate(video_frames):
             if frame_num == 0:
                 continue
-            frame_drawn = self.draw_frame(frame, frame_num, passes, interceptions)
-            output_video_frames.append(frame_drawn)
-        return output_video_frames
+            yield self.draw_frame(frame, frame_num)
 
-    def draw_frame(self, frame, frame_num, passes, interceptions):
-        """
-        Draw a semi-transparent overlay of pass and interception counts on a single frame.
+    def _ensure_layout(self, frame_height, frame_width):
+        """Compute and cache the overlay geometry for a frame size.
 
-        Args:
-            frame (numpy.ndarray): The current video frame.
-            frame_num (int): The index of the current frame.
-            passes (list): A list of pass events up to this frame.
-            interceptions (list): A list of interception events up to this frame.
-
-        Returns:
-            numpy.ndarray: The frame with the overlay and statistics.
+        Runs once per video: later calls with the same size return immediately.
         """
-        overlay = frame.copy()
-        font_scale = 0.7
-        font_thickness = 2
+        if getattr(self, "_layout_shape", None) == (frame_height, frame_width):
+            return
 
-        frame_height, frame_width = overlay.shape[:2]
         rect_x1 = int(frame_width * 0.16)
         rect_y1 = int(frame_height * 0.75)
         rect_x2 = int(frame_width * 0.55)
         rect_y2 = int(frame_height * 0.90)
+
         text_x = int(frame_width * 0.19)
         text_y1 = int(frame_height * 0.80)
         text_y2 = int(frame_height * 0.88)
+        self._overlay = TextBoxOverlay(
+            (rect_x1, rect_y1, rect_x2, rect_y2),
+            ((text_x, text_y1), (text_x, text_y2)),
+            self.font_scale,
+            self.font_thickness,
+            self.alpha,
+        )
+        self._layout_shape = (frame_height, frame_width)
 
-        cv2.rectangle(overlay, (rect_x1, rect_y1), (rect_x2, rect_y2), (255, 255, 255), -1)
-        alpha = 0.8
-        cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0, frame)
+    def draw_frame(self, frame, frame_num):
+        """
+        Draw a semi-transparent overlay of pass and interception counts on a single frame.
 
-        passes_till_frame = passes[: frame_num + 1]
-        interceptions_till_frame = interceptions[: frame_num + 1]
+        ``prepare`` must have been called with the pass and interception events
+        for the video before the first call.
 
-        t1p, t2p, t1i, t2i = self.get_stats(passes_till_frame, interceptions_till_frame)
+        Args:
+            frame (numpy.ndarray): The current video frame.
+            frame_num (int): The index of the current frame.
+
+        Returns:
+            numpy.ndarray: The frame with the overlay and statistics.
+        """
+        self._ensure_layout(*frame.shape[:2])
+
+        t1p = int(running_total_at(self._t1p, frame_num))
+        t2p = int(running_total_at(self._t2p, frame_num))
+        t1i = int(running_total_at(self._t1i, frame_num))
+        t2i = int(running_total_at(self._t2i, frame_num))
 
-        cv2.putText(
-            frame,
+        lines = (
             f"Team 1 - Passes: {t1p} Interceptions: {t1i}",
-            (text_x, text_y1),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            font_scale,
-            (0, 0, 0),
-            font_thickness,
-        )
-        cv2.putText(
-            frame,
             f"Team 2 - Passes: {t2p} Interceptions: {t2i}",
-            (text_x, text_y2),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            font_scale,
-            (0, 0, 0),
-            font_thickness,
         )
-
-        return frame
+        return self._overlay.draw(frame, lines)
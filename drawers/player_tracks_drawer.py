@@ -1,6 +1,6 @@
 """Draw player ellipses, ID labels, and ball-possession indicators."""
 
-from .utils import draw_ellipse, draw_traingle
+from .utils import ColorTable, draw_ellipse, draw_traingle
 
 
 class PlayerTracksDrawer:
@@ -11,6 +11,8 @@ class PlayerTracksDrawer:
         default_player_team_id (int): Default team ID used when a player's team is not specified.
         team_1_color (list): RGB color used to represent Team 1 players.
         team_2_color (list): RGB color used to represent Team 2 players.
+        team_colors (ColorTable): Team colors indexed by ``team_id - 1``.
+        possession_colors (ColorTable): Color of the ball-possession triangle.
     """
 
     def __init__(self, team_1_color=[255, 245, 238], team_2_color=[128, 0, 0]):
@@ -24,41 +26,71 @@ class PlayerTracksDrawer:
         self.default_player_team_id = 1
         self.team_1_color = team_1_color
         self.team_2_color = team_2_color
+        # Row 0 is Team 1, row 1 is Team 2; indexed with ``team_id - 1``.
+        self.team_colors = ColorTable([team_1_color, team_2_color])
+        self.possession_colors = ColorTable([(0, 0, 255)])
+
+    def prepare(self, tracks, player_assignment, ball_aquisition):
+        """
+        Store the per-frame tracking data consumed by ``draw_frame``.
+
+        Args:
+            tracks (list): A list of dictionaries where each dictionary contains player tracking information
+                for the corresponding frame.
+            player_assignment (list): A list of dictionaries indicating team assignments for each player
+                in the corresponding frame.
+            ball_aquisition (list): A list indicating which player has possession of the ball in each frame.
+        """
+        self._tracks = tracks
+        self._player_assignment = player_assignment
+        self._ball_aquisition = ball_aquisition
 
     def draw(self, video_frames, tracks, player_assignment, ball_aquisition):
         """
         Draw player tracks and ball possession indicators on a list of video frames.
 
         Args:
-            video_frames (list): A list of frames (as NumPy arrays or image objects) on which to draw.
+            video_frames (iterable): Frames (as NumPy arrays or image objects) on which to draw.
             tracks (list): A list of dictionaries where each dictionary contains player tracking information
                 for the corresponding frame.
             player_assignment (list): A list of dictionaries indicating team assignments for each player
                 in the corresponding frame.
             ball_aquisition (list): A list indicating which player has possession of the ball in each frame.
 
-        Returns:
-            list: A list of frames with player tracks and ball possession indicators drawn on them.
+        Yields:
+            numpy.ndarray: Each frame with player tracks and ball possession indicators drawn on it.
         """
-        output_video_frames = []
+        self.prepare(tracks, player_assignment, ball_aquisition)
 
         for frame_num, frame in enumerate(video_frames):
-            frame = frame.copy()
-            player_dict = tracks[frame_num]
-            player_assignment_for_frame = player_assignment[frame_num]
-            player_id_has_ball = ball_aquisition[frame_num]
-
-            for track_id, player in player_dict.items():
-                team_id = player_assignment_for_frame.get(
-                    track_id, self.default_player_team_id
-                )
-                color = self.team_1_color if team_id == 1 else self.team_2_color
+            yield self.draw_frame(frame.copy(), frame_num)
 
-                frame = draw_ellipse(frame, player["bbox"], color, track_id)
+    def draw_frame(self, frame, frame_num):
+        """
+        Draw player tracks and the possession indicator on a single frame in place.
 
-                if track_id == player_id_has_ball:
-                    frame = draw_traingle(frame, player["bbox"], (0, 0, 255))
+        Args:
+            frame (numpy.ndarray): The current video frame.
+            frame_num (int): The index of the current frame.
 
-            output_video_frames.append(frame)
+        Returns:
+            numpy.ndarray: The annotated frame.
+        """
+        player_dict = self._tracks[frame_num]
+        player_assignment_for_frame = self._player_assignment[frame_num]
+        player_id_has_ball = self._ball_aquisition[frame_num]
+
+        for track_id, player in player_dict.items():
+            team_id = player_assignment_for_frame.get(
+                track_id, self.default_player_team_id
+            )
+            frame = draw_ellipse(
+                frame, player["bbox"], team_id - 1, self.team_colors, track_id
+            )
+
+            if track_id == player_id_has_ball:
+                frame = draw_traingle(
+                    frame, player["bbox"], 0, self.possession_colors
+                )
 
-        return output_video_frames
+        return frame
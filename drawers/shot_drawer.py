@@ -1,6 +1,8 @@
 """Draw a semi-transparent overlay showing cumulative shot-attempt statistics."""
 
-import cv2
+import numpy as np
+
+from .utils import TextBoxOverlay, running_total_at
 
 
 class ShotDrawer:
@@ -11,7 +13,9 @@ class ShotDrawer:
     """
 
     def __init__(self):
-        pass
+        self.font_scale = 0.6
+        self.font_thickness = 2
+        self.alpha = 0.8
 
     # ------------------------------------------------------------------
     # Stats
@@ -46,6 +50,29 @@ class ShotDrawer:
                     stats[sf]["missed"] += 1
         return stats
 
+    def prepare(self, shot_frames, shot_results):
+        """Precompute running per-team shot totals for every frame.
+
+        Parameters
+        ----------
+        shot_frames : list[int]
+            ``-1`` (no shot), ``1`` (Team 1), or ``2`` (Team 2).
+        shot_results : list[str | None]
+            ``None``, ``"made"``, or ``"missed"``.
+        """
+        sf = np.asarray(shot_frames, dtype=np.int8)
+        made = np.array([r == "made" for r in shot_results], dtype=bool)
+        missed = np.array([r == "missed" for r in shot_results], dtype=bool)
+
+        self._cum = {}
+        for team_id in (1, 2):
+            team_mask = sf == team_id
+            self._cum[team_id] = {
+                "attempts": np.cumsum(team_mask),
+                "made": np.cumsum(team_mask & made),
+                "missed": np.cumsum(team_mask & missed),
+            }
+
     # ------------------------------------------------------------------
     # Drawing
     # ------------------------------------------------------------------
@@ -55,68 +82,61 @@ class ShotDrawer:
 
         Parameters
         ----------
-        video_frames : list[numpy.ndarray]
+        video_frames : iterable of numpy.ndarray
         shot_frames : list[int]
         shot_results : list[str | None]
 
-        Returns
-        -------
-        list[numpy.ndarray]
-            Annotated frames (one fewer than input, frame 0 is skipped).
+        Yields
+        ------
+        numpy.ndarray
+            Each annotated frame (frame 0 is skipped).
         """
-        output_video_frames = []
+        self.prepare(shot_frames, shot_results)
+
         for frame_num, frame in enumerate(video_frames):
             if frame_num == 0:
                 continue
-            frame_drawn = self.draw_frame(frame, frame_num, shot_frames, shot_results)
-            output_video_frames.append(frame_drawn)
-        return output_video_frames
+            yield self.draw_frame(frame, frame_num)
 
-    def draw_frame(self, frame, frame_num, shot_frames, shot_results):
-        """Render the shot-stats overlay on a single frame."""
-        overlay = frame.copy()
-        font_scale = 0.6
-        font_thickness = 2
+    def _ensure_layout(self, frame_height, frame_width):
+        """Compute and cache the overlay geometry for a frame size.
 
-        frame_height, frame_width = overlay.shape[:2]
+        Runs once per video: later calls with the same size return immediately.
+        """
+        if getattr(self, "_layout_shape", None) == (frame_height, frame_width):
+            return
 
         # Position: top-right area
         rect_x1 = int(frame_width * 0.60)
         rect_y1 = int(frame_height * 0.02)
         rect_x2 = int(frame_width * 0.99)
         rect_y2 = int(frame_height * 0.14)
+
         text_x = int(frame_width * 0.62)
         text_y1 = int(frame_height * 0.06)
         text_y2 = int(frame_height * 0.12)
+        self._overlay = TextBoxOverlay(
+            (rect_x1, rect_y1, rect_x2, rect_y2),
+            ((text_x, text_y1), (text_x, text_y2)),
+            self.font_scale,
+            self.font_thickness,
+            self.alpha,
+        )
+        self._layout_shape = (frame_height, frame_width)
 
-        cv2.rectangle(overlay, (rect_x1, rect_y1), (rect_x2, rect_y2), (255, 255, 255), -1)
-        alpha = 0.8
-        cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0, frame)
+    def draw_frame(self, frame, frame_num):
+        """Render the shot-stats overlay on a single frame.
 
-        stats = self.get_stats(
-            shot_frames[: frame_num + 1], shot_results[: frame_num + 1]
-        )
+        ``prepare`` must have been called with the shot events for the video
+        before the first call.
+        """
+        self._ensure_layout(*frame.shape[:2])
 
-        t1 = stats[1]
-        t2 = stats[2]
+        t1 = {k: int(running_total_at(v, frame_num)) for k, v in self._cum[1].items()}
+        t2 = {k: int(running_total_at(v, frame_num)) for k, v in self._cum[2].items()}
 
-        cv2.putText(
-            frame,
+        lines = (
             f"Team 1 Shots: {t1['attempts']}  Made: {t1['made']}  Missed: {t1['missed']}",
-            (text_x, text_y1),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            font_scale,
-            (0, 0, 0),
-            font_thickness,
-        )
-        cv2.putText(
-            frame,
             f"Team 2 Shots: {t2['attempts']}  Made: {t2['made']}  Missed: {t2['missed']}",
-            (text_x, text_y2),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            font_scale,
-            (0, 0, 0),
-            font_thickness,
         )
-
-        return frame
+        return self._overlay.draw(frame, lines)
@@ -1,6 +1,9 @@
 """Draw a mini-map tactical overlay in the top-left corner of each frame."""
 
 import cv2
+import numpy as np
+
+from tactical_view_converter import pack_player_positions
 
 
 class TacticalViewDrawer:
@@ -20,6 +23,87 @@ class TacticalViewDrawer:
         self.team_1_color = team_1_color
         self.team_2_color = team_2_color
 
+    def prepare(
+        self,
+        court_image_path,
+        width,
+        height,
+        tactical_court_keypoints,
+        tactical_player_positions=None,
+        player_assignment=None,
+        ball_acquisition=None,
+    ):
+        """
+        Load the court image and store the per-frame data consumed by ``draw_frame``.
+
+        Args:
+            court_image_path (str): Path to the court image.
+            width (int): Width of the tactical view.
+            height (int): Height of the tactical view.
+            tactical_court_keypoints (list): List of court keypoints in tactical view.
+            tactical_player_positions (list | dict, optional): List of dictionaries mapping player IDs to
+                their positions in tactical view coordinates, or the flat arrays returned by
+                ``pack_player_positions``.
+            player_assignment (list, optional): List of dictionaries mapping player IDs to team assignments.
+                Only used when ``tactical_player_positions`` is a list.
+            ball_acquisition (list, optional): List indicating which player has the ball in each frame.
+        """
+        court_image = cv2.imread(court_image_path)
+        court_image = cv2.resize(court_image, (width, height))
+
+        # The court half of the blend is identical on every frame, so it is
+        # weighted once here and only the frame half is scaled per frame.
+        self._alpha = 0.6
+        self._court_weighted = (court_image.astype(np.float32) * self._alpha).astype(np.uint8)
+        self._court_slice = (
+            slice(self.start_y, self.start_y + height),
+            slice(self.start_x, self.start_x + width),
+        )
+        self._tactical_court_keypoints = tactical_court_keypoints
+        self._keypoint_sprite_shape = None
+        self._players = self._pack_player_positions(
+            tactical_player_positions, player_assignment, ball_acquisition
+        )
+
+    def _pack_player_positions(self, tactical_player_positions, player_assignment, ball_acquisition):
+        """Resolve every player dot to frame-pixel coordinates and colours up front.
+
+        Returns
+        -------
+        tuple
+            ``(starts, xy, colors, has_ball)`` where rows
+            ``starts[i]:starts[i + 1]`` of the other arrays belong to frame
+            ``i``, or ``None`` when there is nothing to draw.
+        """
+        if not tactical_player_positions:
+            return None
+        if isinstance(tactical_player_positions, dict):
+            packed = tactical_player_positions
+        elif player_assignment:
+            packed = pack_player_positions(tactical_player_positions, player_assignment)
+        else:
+            return None
+
+        frame_index = packed["frame_index"]
+        starts = np.searchsorted(frame_index, np.arange(packed["num_frames"] + 1))
+
+        offset = np.array([self.start_x, self.start_y], dtype=np.int32)
+        xy = packed["xy"].astype(np.int32) + offset
+
+        colors = np.where(
+            (packed["team_id"] == 1)[:, None],
+            np.asarray(self.team_1_color),
+            np.asarray(self.team_2_color),
+        )
+
+        ball = np.full(packed["num_frames"], -1, dtype=np.int64)
+        if ball_acquisition:
+            n = min(len(ball_acquisition), packed["num_frames"])
+            ball[:n] = ball_acquisition[:n]
+        has_ball = packed["player_id"] == ball[frame_index]
+
+        return starts, xy, colors, has_ball
+
     def draw(
         self,
         video_frames,
@@ -34,8 +118,10 @@ class TacticalViewDrawer:
         """
         Draw tactical view with court keypoints and player positions.
 
+        Frames are annotated in place; the caller owns the frame buffers.
+
         Args:
-            video_frames (list): List of video frames to draw on.
+            video_frames (iterable): Video frames to draw on.
             court_image_path (str): Path to the court image.
             width (int): Width of the tactical view.
             height (int): Height of the tactical view.
@@ -45,68 +131,98 @@ class TacticalViewDrawer:
             player_assignment (list, optional): List of dictionaries mapping player IDs to team assignments.
             ball_acquisition (list, optional): List indicating which player has the ball in each frame.
 
-        Returns:
-            list: List of frames with tactical view drawn on them.
+        Yields:
+            numpy.ndarray: Each frame with the tactical view drawn on it.
         """
-        court_image = cv2.imread(court_image_path)
-        court_image = cv2.resize(court_image, (width, height))
+        self.prepare(
+            court_image_path,
+            width,
+            height,
+            tactical_court_keypoints,
+            tactical_player_positions,
+            player_assignment,
+            ball_acquisition,
+        )
 
-        output_video_frames = []
         for frame_idx, frame in enumerate(video_frames):
-            frame = frame.copy()
-
-            # Blend the court image into the overlay region
-            y1 = self.start_y
-            y2 = self.start_y + height
-            x1 = self.start_x
-            x2 = self.start_x + width
-
-            alpha = 0.6
-            overlay = frame[y1:y2, x1:x2].copy()
-            cv2.addWeighted(court_image, alpha, overlay, 1 - alpha, 0, frame[y1:y2, x1:x2])
-
-            # Draw court keypoints
-            for kp_index, keypoint in enumerate(tactical_court_keypoints):
-                x, y = keypoint
-                x += self.start_x
-                y += self.start_y
-                cv2.circle(frame, (x, y), 5, (0, 0, 255), -1)
-                cv2.putText(
-                    frame, str(kp_index), (x, y),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2,
-                )
-
-            # Draw player positions
-            if (
-                tactical_player_positions
-                and player_assignment
-                and frame_idx < len(tactical_player_positions)
+            yield self.draw_frame(frame, frame_idx)
+
+    def _build_keypoint_sprite(self, frame_shape):
+        """Render the static court keypoints (dots + labels) once for a frame size.
+
+        The circles and labels are drawn exactly as they would be on the frame
+        into a sprite covering the mini-map plus a margin for labels that
+        overhang it.  Rendering once over black and once over white recovers
+        how much of the underlying frame shows through each pixel, so
+        anti-aliased glyph edges are reproduced as well.
+        """
+        font, font_scale, thickness, radius = cv2.FONT_HERSHEY_SIMPLEX, 0.5, 2, 5
+        labels = [str(i) for i in range(len(self._tactical_court_keypoints))]
+        text_sizes = [cv2.getTextSize(label, font, font_scale, thickness)[0] for label in labels]
+        margin = max([max(w, h) for w, h in text_sizes] + [0]) + 2 * thickness + radius
+
+        frame_height, frame_width = frame_shape
+        y1 = max(self.start_y - margin, 0)
+        x1 = max(self.start_x - margin, 0)
+        y2 = min(self.start_y + self._court_weighted.shape[0] + margin, frame_height)
+        x2 = min(self.start_x + self._court_weighted.shape[1] + margin, frame_width)
+
+        on_black = np.zeros((y2 - y1, x2 - x1, 3), dtype=np.uint8)
+        on_white = np.full((y2 - y1, x2 - x1, 3), 255, dtype=np.uint8)
+        for canvas in (on_black, on_white):
+            for label, keypoint in zip(labels, self._tactical_court_keypoints):
+                x = keypoint[0] + self.start_x - x1
+                y = keypoint[1] + self.start_y - y1
+                cv2.circle(canvas, (x, y), radius, (0, 0, 255), -1)
+                cv2.putText(canvas, label, (x, y), font, font_scale, (0, 255, 0), thickness)
+
+        # Per-pixel weight (0..255) of the frame underneath the sprite
+        see_through = on_white.astype(np.int16) - on_black
+        mask = (see_through < 255).any(axis=-1)
+
+        self._keypoint_slice = (slice(y1, y2), slice(x1, x2))
+        self._keypoint_mask = mask
+        self._keypoint_sprite = on_black[mask].astype(np.uint16)
+        self._keypoint_see_through = see_through[mask].astype(np.uint16)
+        self._keypoint_sprite_shape = frame_shape
+
+    def draw_frame(self, frame, frame_idx):
+        """
+        Draw the tactical mini-map on a single frame in place.
+
+        ``prepare`` must have been called before the first call.
+
+        Args:
+            frame (numpy.ndarray): The current video frame.
+            frame_idx (int): The index of the current frame.
+
+        Returns:
+            numpy.ndarray: The annotated frame.
+        """
+        # Blend the court image into the overlay region
+        roi = frame[self._court_slice]
+        cv2.addWeighted(self._court_weighted, 1.0, roi, 1 - self._alpha, 0, dst=roi)
+
+        # Stamp the pre-rendered court keypoints
+        if getattr(self, "_keypoint_sprite_shape", None) != frame.shape[:2]:
+            self._build_keypoint_sprite(frame.shape[:2])
+        region = frame[self._keypoint_slice]
+        under = region[self._keypoint_mask].astype(np.uint16)
+        stamped = self._keypoint_sprite + (under * self._keypoint_see_through + 127) // 255
+        region[self._keypoint_mask] = np.minimum(stamped, 255).astype(np.uint8)
+
+        # Draw player positions
+        if self._players is not None and frame_idx + 1 < len(self._players[0]):
+            starts, xy, colors, has_ball = self._players
+            s, e = starts[frame_idx], starts[frame_idx + 1]
+
+            player_radius = 8
+            for (x, y), color, ball in zip(
+                xy[s:e].tolist(), colors[s:e].tolist(), has_ball[s:e].tolist()
             ):
-                frame_positions = tactical_player_positions[frame_idx]
-                frame_assignments = (
-                    player_assignment[frame_idx]
-                    if frame_idx < len(player_assignment)
-                    else {}
-                )
-                player_with_ball = (
-                    ball_acquisition[frame_idx]
-                    if ball_acquisition and frame_idx < len(ball_acquisition)
-                    else -1
-                )
-
-                for player_id, position in frame_positions.items():
-                    team_id = frame_assignments.get(player_id, 1)
-                    color = self.team_1_color if team_id == 1 else self.team_2_color
-
-                    x = int(position[0]) + self.start_x
-                    y = int(position[1]) + self.start_y
-
-                    player_radius = 8
-                    cv2.circle(frame, (x, y), player_radius, color, -1)
-
-                    if player_id == player_with_ball:
-                        cv2.circle(frame, (x, y), player_radius + 3, (0, 0, 255), 2)
-
-            output_video_frames.append(frame)
-
-        return output_video_frames
+                cv2.circle(frame, (x, y), player_radius, color, -1)
+
+                if ball:
+                    cv2.circle(frame, (x, y), player_radius + 3, (0, 0, 255), 2)
+
+        return frame
@@ -1,8 +1,9 @@
 """Draw a semi-transparent overlay showing cumulative ball-control percentages."""
 
-import cv2
 import numpy as np
 
+from .utils import TextBoxOverlay, running_total_at
+
 
 class TeamBallControlDrawer:
     """
@@ -10,7 +11,9 @@ class TeamBallControlDrawer:
     """
 
     def __init__(self):
-        pass
+        self.font_scale = 0.7
+        self.font_thickness = 2
+        self.alpha = 0.8
 
     # ------------------------------------------------------------------
     # Stats
@@ -29,20 +32,33 @@ class TeamBallControlDrawer:
             numpy.ndarray: An array indicating which team has ball control for each frame
                 (1 for Team 1, 2 for Team 2, -1 for no control).
         """
-        team_ball_control = []
-        for assignment_frame, acquisition_frame in zip(player_assignment, ball_aquisition):
-            if acquisition_frame == -1:
-                team_ball_control.append(-1)
-                continue
-            if acquisition_frame not in assignment_frame:
-                team_ball_control.append(-1)
-                continue
-            if assignment_frame[acquisition_frame] == 1:
-                team_ball_control.append(1)
-            else:
-                team_ball_control.append(2)
+        num_frames = min(len(player_assignment), len(ball_aquisition))
+        holder_team = np.fromiter(
+            (
+                assignment_frame.get(acquisition_frame, -1) if acquisition_frame != -1 else -1
+                for assignment_frame, acquisition_frame in zip(player_assignment, ball_aquisition)
+            ),
+            dtype=np.int64,
+            count=num_frames,
+        )
+
+        team_ball_control = np.where(holder_team == 1, 1, 2).astype(np.int8)
+        team_ball_control[holder_team == -1] = -1
+        return team_ball_control
 
-        return np.array(team_ball_control)
+    def prepare(self, player_assignment, ball_aquisition):
+        """
+        Precompute the running ball-control percentages for every frame.
+
+        Args:
+            player_assignment (list): A list of dictionaries indicating team assignments for each player
+                in the corresponding frame.
+            ball_aquisition (list): A list indicating which player has possession of the ball in each frame.
+        """
+        team_ball_control = self.get_team_ball_control(player_assignment, ball_aquisition)
+        frames_so_far = np.arange(1, team_ball_control.shape[0] + 1)
+        self._team_1_pct = np.cumsum(team_ball_control == 1) / frames_so_far
+        self._team_2_pct = np.cumsum(team_ball_control == 2) / frames_so_far
 
     # ------------------------------------------------------------------
     # Drawing
@@ -53,75 +69,67 @@ class TeamBallControlDrawer:
         Draw team ball control statistics on a list of video frames.
 
         Args:
-            video_frames (list): A list of frames (as NumPy arrays or image objects) on which to draw.
+            video_frames (iterable): Frames (as NumPy arrays or image objects) on which to draw.
             player_assignment (list): A list of dictionaries indicating team assignments for each player
                 in the corresponding frame.
             ball_aquisition (list): A list indicating which player has possession of the ball in each frame.
 
-        Returns:
-            list: A list of frames with team ball control statistics drawn on them.
+        Yields:
+            numpy.ndarray: Each frame (after the first) with team ball control statistics drawn on it.
         """
-        team_ball_control = self.get_team_ball_control(player_assignment, ball_aquisition)
+        self.prepare(player_assignment, ball_aquisition)
 
-        output_video_frames = []
         for frame_num, frame in enumerate(video_frames):
             if frame_num == 0:
                 continue
-            frame_drawn = self.draw_frame(frame, frame_num, team_ball_control)
-            output_video_frames.append(frame_drawn)
-        return output_video_frames
+            yield self.draw_frame(frame, frame_num)
 
-    def draw_frame(self, frame, frame_num, team_ball_control):
-        """
-        Draw a semi-transparent overlay of team ball control percentages on a single frame.
-
-        Args:
-            frame (numpy.ndarray): The current video frame on which the overlay will be drawn.
-            frame_num (int): The index of the current frame.
-            team_ball_control (numpy.ndarray): An array indicating which team has ball control for each frame.
+    def _ensure_layout(self, frame_height, frame_width):
+        """Compute and cache the overlay geometry for a frame size.
 
-        Returns:
-            numpy.ndarray: The frame with the semi-transparent overlay and statistics.
+        Runs once per video: later calls with the same size return immediately.
         """
-        overlay = frame.copy()
-        font_scale = 0.7
-        font_thickness = 2
+        if getattr(self, "_layout_shape", None) == (frame_height, frame_width):
+            return
 
-        frame_height, frame_width = overlay.shape[:2]
         rect_x1 = int(frame_width * 0.60)
         rect_y1 = int(frame_height * 0.75)
         rect_x2 = int(frame_width * 0.99)
         rect_y2 = int(frame_height * 0.90)
+
         text_x = int(frame_width * 0.63)
         text_y1 = int(frame_height * 0.80)
         text_y2 = int(frame_height * 0.88)
+        self._overlay = TextBoxOverlay(
+            (rect_x1, rect_y1, rect_x2, rect_y2),
+            ((text_x, text_y1), (text_x, text_y2)),
+            self.font_scale,
+            self.font_thickness,
+            self.alpha,
+        )
+        self._layout_shape = (frame_height, frame_width)
 
-        cv2.rectangle(overlay, (rect_x1, rect_y1), (rect_x2, rect_y2), (255, 255, 255), -1)
-        alpha = 0.8
-        cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0, frame)
+    def draw_frame(self, frame, frame_num):
+        """
+        Draw a semi-transparent overlay of team ball control percentages on a single frame.
 
-        control_slice = team_ball_control[: frame_num + 1]
-        total = control_slice.shape[0]
-        team_1_pct = control_slice[control_slice == 1].shape[0] / total if total else 0
-        team_2_pct = control_slice[control_slice == 2].shape[0] / total if total else 0
+        ``prepare`` must have been called with the assignment and possession data
+        for the video before the first call.
 
-        cv2.putText(
-            frame,
+        Args:
+            frame (numpy.ndarray): The current video frame on which the overlay will be drawn.
+            frame_num (int): The index of the current frame.
+
+        Returns:
+            numpy.ndarray: The frame with the semi-transparent overlay and statistics.
+        """
+        self._ensure_layout(*frame.shape[:2])
+
+        team_1_pct = running_total_at(self._team_1_pct, frame_num)
+        team_2_pct = running_total_at(self._team_2_pct, frame_num)
+
+        lines = (
             f"Team 1 Ball Control: {team_1_pct * 100:.2f}%",
-            (text_x, text_y1),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            font_scale,
-            (0, 0, 0),
-            font_thickness,
-        )
-        cv2.putText(
-            frame,
             f"Team 2 Ball Control: {team_2_pct * 100:.2f}%",
-            (text_x, text_y2),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            font_scale,
-            (0, 0, 0),
-            font_thickness,
         )
-
-        return frame
+        return self._overlay.draw(frame, lines)
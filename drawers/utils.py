@@ -2,7 +2,9 @@
 Shared drawing primitives used by the various drawer classes.
 
 Provides filled-triangle and annotated-ellipse helpers that are rendered
-on top of video frames to indicate ball and player positions.
+on top of video frames to indicate ball and player positions, plus the
+``ColorTable`` lookup those helpers take their colors from and the
+``TextBoxOverlay`` and ``running_total_at`` helpers of the stat overlays.
 """
 
 import cv2
@@ -11,14 +13,45 @@ import numpy as np
 from utils import get_center_of_bbox, get_bbox_width, get_foot_position
 
 
-def draw_traingle(frame, bbox, color):
+class ColorTable:
+    """
+    A fixed lookup table of BGR colors indexed by an integer id.
+
+    The colors are kept as a ``(T, 3)`` uint8 array and converted once to the
+    tuples of Python ints OpenCV expects, so per-call lookups are a single
+    index into a prebuilt tuple.
+
+    Attributes:
+        colors (numpy.ndarray): A ``(T, 3)`` uint8 array of BGR colors.
+    """
+
+    def __init__(self, colors):
+        """
+        Initialize the table from a sequence of BGR colors.
+
+        Args:
+            colors (list): A sequence of ``(B, G, R)`` colors; row ``i`` is the color for id ``i``.
+        """
+        self.colors = np.array(colors, dtype=np.uint8).reshape(-1, 3)
+        self._tuples = tuple(tuple(int(v) for v in row) for row in self.colors)
+
+    def __len__(self):
+        return len(self._tuples)
+
+    def __getitem__(self, index):
+        """Return the color for *index* as an OpenCV-ready ``(B, G, R)`` tuple."""
+        return self._tuples[index]
+
+
+def draw_traingle(frame, bbox, color_id, table):
     """
     Draws a filled triangle on the given frame at the specified bounding box location.
 
     Args:
         frame (numpy.ndarray): The frame on which to draw the triangle.
         bbox (tuple): A tuple representing the bounding box (x1, y1, x2, y2).
-        color (tuple): The color of the triangle in BGR format.
+        color_id (int): Index of the triangle color in ``table``.
+        table (ColorTable): The color table to look the color up in.
 
     Returns:
         numpy.ndarray: The frame with the triangle drawn on it.
@@ -31,12 +64,12 @@ def draw_traingle(frame, bbox, color):
         [x - 10, y - 20],
         [x + 10, y - 20],
     ])
-    cv2.drawContours(frame, [triangle_points], 0, color, cv2.FILLED)
+    cv2.drawContours(frame, [triangle_points], 0, table[color_id], cv2.FILLED)
     cv2.drawContours(frame, [triangle_points], 0, (0, 0, 0), 2)
     return frame
 
 
-def draw_ellipse(frame, bbox, color, track_id=None):
+def draw_ellipse(frame, bbox, team_id, table, track_id=None):
     """
     Draws an ellipse and an optional rectangle with a track ID on the given frame
     at the specified bounding box location.
@@ -44,7 +77,8 @@ def draw_ellipse(frame, bbox, color, track_id=None):
     Args:
         frame (numpy.ndarray): The frame on which to draw the ellipse.
         bbox (tuple): A tuple representing the bounding box (x1, y1, x2, y2).
-        color (tuple): The color of the ellipse in BGR format.
+        team_id (int): Index of the ellipse color in ``table``.
+        table (ColorTable): The color table to look the color up in.
         track_id (int, optional): The track ID to display inside a rectangle.
 
     Returns:
@@ -53,6 +87,7 @@ def draw_ellipse(frame, bbox, color, track_id=None):
     y2 = int(bbox[3])
     x_center, _ = get_center_of_bbox(bbox)
     width = get_bbox_width(bbox)
+    color = table[team_id]
 
     cv2.ellipse(
         frame,
@@ -96,3 +131,133 @@ def draw_ellipse(frame, bbox, color, track_id=None):
         )
 
     return frame
+
+
+def running_total_at(running_totals, frame_num):
+    """
+    Look up a precomputed running total at a frame, holding the last value.
+
+    Frames past the end of the data show the final total, as summing every
+    event up to such a frame would, and an empty array reads as ``0``.
+
+    Args:
+        running_totals (numpy.ndarray): A cumulative per-frame array, e.g. from ``np.cumsum``.
+        frame_num (int): The index of the current frame.
+
+    Returns:
+        The running total at ``frame_num``.
+    """
+    if running_totals.shape[0] == 0:
+        return 0
+    return running_totals[min(frame_num, running_totals.shape[0] - 1)]
+
+
+class TextBoxOverlay:
+    """
+    A semi-transparent white box with lines of opaque black text.
+
+    The box is blended into the frame with a single ``cv2.addWeighted`` over
+    its region of interest. The text is rendered once into a box-sized scratch
+    buffer, from which its pixels and their shade are kept; each frame then
+    darkens just those pixels of the blended box by that shade, giving the
+    same result as drawing the text after the blend. The text is only re-rendered when it changes, so overlays whose
+    numbers stay constant for long stretches skip ``cv2.putText`` entirely on
+    most frames. Lines that would not fit inside the box fall back to being
+    drawn on the frame after the blend.
+
+    Attributes:
+        box (tuple): The box corners (x1, y1, x2, y2) in frame coordinates, inclusive.
+        text_origins (tuple): The bottom-left origin of each text line in frame coordinates.
+        font_scale (float): Font scale passed to ``cv2.putText``.
+        font_thickness (int): Stroke thickness passed to ``cv2.putText``.
+        alpha (float): Opacity of the box.
+    """
+
+    def __init__(self, box, text_origins, font_scale, font_thickness, alpha):
+        """
+        Initialize the overlay and allocate its scratch buffers.
+
+        Args:
+            box (tuple): The box corners (x1, y1, x2, y2) in frame coordinates, inclusive.
+            text_origins (tuple): The bottom-left origin of each text line in frame coordinates.
+            font_scale (float): Font scale passed to ``cv2.putText``.
+            font_thickness (int): Stroke thickness passed to ``cv2.putText``.
+            alpha (float): Opacity of the box.
+        """
+        self.box = box
+        self.text_origins = text_origins
+        self.font_scale = font_scale
+        self.font_thickness = font_thickness
+        self.alpha = alpha
+
+        x1, y1, x2, y2 = box
+        # cv2.rectangle is inclusive of the far corner, so extend by one pixel
+        self._roi = (slice(y1, y2 + 1), slice(x1, x2 + 1))
+        self._white = np.full((y2 - y1 + 1, x2 - x1 + 1, 3), 255, dtype=np.uint8)
+        self._text_buf = np.empty_like(self._white)
+        self._text_pixels = None
+        self._text_shade = None
+        self._buf_origins = tuple((x - x1, y - y1) for x, y in text_origins)
+        self._lines = None
+        self._fits = False
+
+    def _render(self, lines):
+        """Render *lines* into the scratch buffer and record where their pixels are."""
+        box_h, box_w = self._white.shape[:2]
+        self._fits = True
+        for line, (x, y) in zip(lines, self._buf_origins):
+            (text_w, text_h), baseline = cv2.getTextSize(
+                line, cv2.FONT_HERSHEY_SIMPLEX, self.font_scale, self.font_thickness
+            )
+            if x < 0 or y - text_h < 0 or x + text_w > box_w or y + baseline > box_h:
+                self._fits = False
+                return
+
+        self._text_buf[:] = 255
+        for line, origin in zip(lines, self._buf_origins):
+            cv2.putText(
+                self._text_buf,
+                line,
+                origin,
+                cv2.FONT_HERSHEY_SIMPLEX,
+                self.font_scale,
+                (0, 0, 0),
+                self.font_thickness,
+            )
+        # Black text over white leaves each pixel at 255 times the share of
+        # the background still showing, which scales the blended box the same way
+        self._text_pixels = np.nonzero(self._text_buf[..., 0] != 255)
+        self._text_shade = self._text_buf[self._text_pixels] / np.float32(255)
+
+    def draw(self, frame, lines):
+        """
+        Blend the box into *frame* in place and draw *lines* of text on it.
+
+        Args:
+            frame (numpy.ndarray): The frame to draw on.
+            lines (tuple): One string per entry of ``text_origins``.
+
+        Returns:
+            numpy.ndarray: The frame with the overlay drawn on it.
+        """
+        if lines != self._lines:
+            self._lines = lines
+            self._render(lines)
+
+        roi = frame[self._roi]
+        cv2.addWeighted(self._white, self.alpha, roi, 1 - self.alpha, 0, dst=roi)
+        if self._fits:
+            roi[self._text_pixels] = roi[self._text_pixels] * self._text_shade + 0.5
+            return frame
+
+        for line, origin in zip(lines, self.text_origins):
+            cv2.putText(
+                frame,
+                line,
+                origin,
+                cv2.FONT_HERSHEY_SIMPLEX,
+                self.font_scale,
+                (0, 0, 0),
+                self.font_thickness,
+            )
+        return frame
@@ -4,7 +4,7 @@ Basketball Video Analysis — main pipeline entry-point.
 Usage::
 
     python main.py input_video.mp4 \\
-        --output_video output_videos/output.avi \\
+        --output_video output_videos/output.mp4 \\
         --stub_path stubs/
 
 The pipeline runs detection, tracking, team assignment, possession analysis,
@@ -15,15 +15,25 @@ the video frames before writing the output file.
 
 import os
 import argparse
-
-from utils import read_video, save_video
+from concurrent.futures import ThreadPoolExecutor
+
+from utils import (
+    read_video,
+    iter_video,
+    save_video,
+    get_video_fps,
+    read_stub,
+    save_stub,
+    file_cache_key,
+    stage_cache_key,
+)
 from trackers import PlayerTracker, BallTracker
 from team_assigner import TeamAssigner
 from court_keypoint_detector import CourtKeypointDetector
 from ball_aquisition import BallAquisitionDetector
 from pass_and_interception_detector import PassAndInterceptionDetector
 from shot_detector import ShotDetector
-from tactical_view_converter import TacticalViewConverter
+from tactical_view_converter import TacticalViewConverter, pack_player_positions
 from speed_and_distance_calculator import SpeedAndDistanceCalculator
 from drawers import (
     PlayerTracksDrawer,
@@ -34,6 +44,7 @@ from drawers import (
     PassInterceptionDrawer,
     TacticalViewDrawer,
     ShotDrawer,
+    CompositeDrawer,
 )
 from configs import (
     STUBS_DEFAULT_PATH,
@@ -41,6 +52,8 @@ from configs import (
     BALL_DETECTOR_PATH,
     COURT_KEYPOINT_DETECTOR_PATH,
     OUTPUT_VIDEO_PATH,
+    PLAYER_DETECTION_STRIDE,
+    DETECTOR_INT8,
 )
 
 
@@ -77,51 +90,97 @@ def main():
     # 1. Read video
     # ------------------------------------------------------------------
     video_frames = read_video(args.input_video)
-
-    # ------------------------------------------------------------------
-    # 2. Detection & tracking
-    # ------------------------------------------------------------------
-    player_tracker = PlayerTracker(PLAYER_DETECTOR_PATH)
-    ball_tracker = BallTracker(BALL_DETECTOR_PATH)
-
-    player_tracks = player_tracker.get_object_tracks(
-        video_frames,
-        read_from_stub=True,
-        stub_path=os.path.join(args.stub_path, "player_track_stubs.pkl"),
+    video_fps = get_video_fps(args.input_video)
+
+    # Each cached stage's stub is named after a key covering its inputs: the
+    # video and model files, the configuration that shapes its output and the
+    # keys of the stages it consumes.  A stub is reused only while all of
+    # them are unchanged.
+    video_key = file_cache_key(args.input_video)
+
+    def stub_path_for(stage, key):
+        return os.path.join(args.stub_path, f"{stage}_{key}.pkl")
+
+    player_tracks_key = stage_cache_key(
+        video_key,
+        PLAYER_DETECTOR_PATH,
+        file_cache_key(PLAYER_DETECTOR_PATH),
+        DETECTOR_INT8,
+        PLAYER_DETECTION_STRIDE,
     )
-
-    ball_tracks = ball_tracker.get_object_tracks(
-        video_frames,
-        read_from_stub=True,
-        stub_path=os.path.join(args.stub_path, "ball_track_stubs.pkl"),
+    ball_tracks_key = stage_cache_key(
+        video_key, BALL_DETECTOR_PATH, file_cache_key(BALL_DETECTOR_PATH), DETECTOR_INT8
+    )
+    court_keypoints_key = stage_cache_key(
+        video_key,
+        COURT_KEYPOINT_DETECTOR_PATH,
+        file_cache_key(COURT_KEYPOINT_DETECTOR_PATH),
+        DETECTOR_INT8,
     )
 
     # ------------------------------------------------------------------
-    # 3. Court keypoints
+    # 2. Detection & tracking  +  3. Court keypoints
     # ------------------------------------------------------------------
-    court_keypoint_detector = CourtKeypointDetector(COURT_KEYPOINT_DETECTOR_PATH)
-
-    court_keypoints_per_frame = court_keypoint_detector.get_court_keypoints(
-        video_frames,
-        read_from_stub=True,
-        stub_path=os.path.join(args.stub_path, "court_key_points_stub.pkl"),
+    # The three models are independent and release the GIL during
+    # inference, so they run side by side over the same decoded frames.
+    calibration_frames = video_frames if DETECTOR_INT8 else None
+    # The tracker only sees keyframes, so it runs at a fraction of the video fps
+    player_tracker = PlayerTracker(
+        PLAYER_DETECTOR_PATH,
+        calibration_frames,
+        frame_rate=video_fps / PLAYER_DETECTION_STRIDE,
+    )
+    ball_tracker = BallTracker(BALL_DETECTOR_PATH, calibration_frames)
+    court_keypoint_detector = CourtKeypointDetector(
+        COURT_KEYPOINT_DETECTOR_PATH, calibration_frames
     )
+    # Drop the extra reference so the frames can be freed once analysis is done
+    del calibration_frames
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        player_tracks_future = pool.submit(
+            player_tracker.get_object_tracks,
+            video_frames,
+            read_from_stub=True,
+            stub_path=stub_path_for("player_tracks", player_tracks_key),
+            stride=PLAYER_DETECTION_STRIDE,
+        )
+        ball_tracks_future = pool.submit(
+            ball_tracker.get_object_tracks,
+            video_frames,
+            read_from_stub=True,
+            stub_path=stub_path_for("ball_tracks", ball_tracks_key),
+        )
+        court_keypoints_future = pool.submit(
+            court_keypoint_detector.get_court_keypoints,
+            video_frames,
+            read_from_stub=True,
+            stub_path=stub_path_for("court_key_points", court_keypoints_key),
+        )
+
+    player_tracks = player_tracks_future.result()
+    ball_tracks = ball_tracks_future.result()
+    court_keypoints_per_frame = court_keypoints_future.result()
 
     # ------------------------------------------------------------------
     # 4. Ball post-processing
     # ------------------------------------------------------------------
-    ball_tracks = ball_tracker.remove_wrong_detections(ball_tracks)
-    ball_tracks = ball_tracker.interpolate_ball_positions(ball_tracks)
+    ball_tracks = ball_tracker.clean_ball_positions(ball_tracks)
 
     # ------------------------------------------------------------------
     # 5. Team assignment
     # ------------------------------------------------------------------
     team_assigner = TeamAssigner()
+    player_assignment_key = stage_cache_key(
+        player_tracks_key,
+        team_assigner.team_1_class_name,
+        team_assigner.team_2_class_name,
+    )
     player_assignment = team_assigner.get_player_teams_across_frames(
         video_frames,
         player_tracks,
         read_from_stub=True,
-        stub_path=os.path.join(args.stub_path, "player_assignment_stub.pkl"),
+        stub_path=stub_path_for("player_assignment", player_assignment_key),
     )
 
     # ------------------------------------------------------------------
@@ -162,8 +221,25 @@ def main():
     court_keypoints_per_frame = tactical_view_converter.validate_keypoints(
         court_keypoints_per_frame
     )
-    tactical_player_positions = tactical_view_converter.transform_players_to_tactical_view(
-        court_keypoints_per_frame, player_tracks
+    tactical_stub_path = stub_path_for(
+        "tactical_player_positions",
+        stage_cache_key(
+            court_keypoints_key,
+            player_tracks_key,
+            tactical_view_converter.court_image_path,
+            tactical_view_converter.width,
+            tactical_view_converter.height,
+            tactical_view_converter.key_points,
+        ),
+    )
+    tactical_player_positions = read_stub(True, tactical_stub_path)
+    if tactical_player_positions is None:
+        tactical_player_positions = tactical_view_converter.transform_players_to_tactical_view(
+            court_keypoints_per_frame, player_tracks
+        )
+        save_stub(tactical_stub_path, tactical_player_positions)
+    tactical_position_arrays = pack_player_positions(
+        tactical_player_positions, player_assignment
     )
 
     # ==================================================================
@@ -180,51 +256,47 @@ def main():
     tactical_view_drawer = TacticalViewDrawer()
     shot_drawer = ShotDrawer()
 
-    # --- layer 1: player + ball tracks ---
-    output_video_frames = player_tracks_drawer.draw(
-        video_frames, player_tracks, player_assignment, ball_aquisition
-    )
-    output_video_frames = ball_tracks_drawer.draw(output_video_frames, ball_tracks)
-
-    # --- layer 2: court keypoints ---
-    output_video_frames = court_keypoint_drawer.draw(
-        output_video_frames, court_keypoints_per_frame
-    )
-
-    # --- layer 3: frame number ---
-    output_video_frames = frame_number_drawer.draw(output_video_frames)
-
-    # --- layer 4: ball control ---
-    output_video_frames = team_ball_control_drawer.draw(
-        output_video_frames, player_assignment, ball_aquisition
-    )
-
-    # --- layer 5: passes & interceptions ---
-    output_video_frames = pass_and_interceptions_drawer.draw(
-        output_video_frames, passes, interceptions
-    )
-
-    # --- layer 6: shot stats  ★ NEW ---
-    output_video_frames = shot_drawer.draw(
-        output_video_frames, shot_frames, shot_results
-    )
-
-    # --- layer 8: tactical mini-map ---
-    output_video_frames = tactical_view_drawer.draw(
-        output_video_frames,
+    # --- hand each layer its per-frame data ---
+    player_tracks_drawer.prepare(player_tracks, player_assignment, ball_aquisition)
+    ball_tracks_drawer.prepare(ball_tracks)
+    court_keypoint_drawer.prepare(court_keypoints_per_frame)
+    team_ball_control_drawer.prepare(player_assignment, ball_aquisition)
+    pass_and_interceptions_drawer.prepare(passes, interceptions)
+    shot_drawer.prepare(shot_frames, shot_results)
+    tactical_view_drawer.prepare(
         tactical_view_converter.court_image_path,
         tactical_view_converter.width,
         tactical_view_converter.height,
         tactical_view_converter.key_points,
-        tactical_player_positions,
+        tactical_position_arrays,
         player_assignment,
         ball_aquisition,
     )
 
+    # --- stack the layers, bottom first ---
+    composite_drawer = CompositeDrawer(
+        [
+            player_tracks_drawer,           # layer 1: player + ball tracks
+            ball_tracks_drawer,
+            court_keypoint_drawer,          # layer 2: court keypoints
+            frame_number_drawer,            # layer 3: frame number
+            team_ball_control_drawer,       # layer 4: ball control
+            pass_and_interceptions_drawer,  # layer 5: passes & interceptions
+            shot_drawer,                    # layer 6: shot stats
+            tactical_view_drawer,           # layer 8: tactical mini-map
+        ]
+    )
+
     # ------------------------------------------------------------------
-    # 12. Save output
+    # 12. Render & save output
     # ------------------------------------------------------------------
-    save_video(output_video_frames, args.output_video)
+    # The analysis above only needs the small per-frame results, so the
+    # decoded frames are released and the video is streamed a second time:
+    # a reader thread decodes, this thread draws, a writer thread encodes.
+    del video_frames
+
+    output_video_frames = composite_drawer.draw(iter_video(args.input_video))
+    save_video(output_video_frames, args.output_video, fps=video_fps)
 
 
 if __name__ == "__main__":
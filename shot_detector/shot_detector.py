@@ -14,8 +14,13 @@ The detector outputs three parallel frame-level lists:
 * ``shot_team``    — team id of the shooter (carried from the possession data)
 """
 
+import numpy as np
+
 from utils.bbox_utils import get_center_of_bbox
 
+# Stored in place of the ball-centre y on frames where the ball is unknown
+_NO_BALL_Y = np.iinfo(np.int16).min
+
 
 class ShotDetector:
     """Detect basketball shot attempts from ball trajectory and possession data.
@@ -77,6 +82,22 @@ class ShotDetector:
         _, cy = get_center_of_bbox(bbox)
         return cy
 
+    def _get_ball_center_ys(self, ball_tracks):
+        """Return the ball-centre y of every frame as an ``int16`` array.
+
+        Centres are whole pixels, so ``int16`` holds them exactly for any
+        frame height; frames without a ball hold ``_NO_BALL_Y``.
+        """
+        center_ys = (
+            self._get_ball_center_y(ball_tracks, frame_num)
+            for frame_num in range(len(ball_tracks))
+        )
+        return np.fromiter(
+            (_NO_BALL_Y if cy is None else cy for cy in center_ys),
+            dtype=np.int16,
+            count=len(ball_tracks),
+        )
+
     def _find_recent_possessor(self, ball_acquisition, player_assignment, frame_num):
         """Look back to find the most recent player with possession and their team.
 
@@ -125,24 +146,29 @@ class ShotDetector:
         scoring_zone_y = int(frame_height * self.scoring_zone_y_ratio)
         last_shot_frame = -self.shot_cooldown_frames  # allow the first shot immediately
 
-        for frame_num in range(self.lookback_frames, num_frames):
+        # Each frame's ball centre is looked up once, ahead of the scan
+        ball_cy = self._get_ball_center_ys(ball_tracks)
+
+        # --- frames whose upward displacement clears the threshold ---
+        # positive = ball moving up; frames without a ball never count as a hit
+        lookback = self.lookback_frames
+        # Both slices hold the same number of frames, none on clips shorter
+        # than the lookback window
+        num_pairs = max(num_frames - lookback, 0)
+        past_y = ball_cy[:num_pairs]
+        current_y = ball_cy[lookback:lookback + num_pairs]
+        both_known = (past_y != _NO_BALL_Y) & (current_y != _NO_BALL_Y)
+        # widen before subtracting so the difference cannot overflow int16
+        upward_displacement = past_y.astype(np.int32) - current_y
+        candidates = np.nonzero(
+            both_known & (upward_displacement >= self.upward_threshold)
+        )[0] + lookback
+
+        for frame_num in candidates.tolist():
             # --- cooldown guard ---
             if (frame_num - last_shot_frame) < self.shot_cooldown_frames:
                 continue
 
-            # --- compute upward displacement ---
-            current_y = self._get_ball_center_y(ball_tracks, frame_num)
-            past_y = self._get_ball_center_y(
-                ball_tracks, frame_num - self.lookback_frames
-            )
-            if current_y is None or past_y is None:
-                continue
-
-            upward_displacement = past_y - current_y  # positive = ball moving up
-
-            if upward_displacement < self.upward_threshold:
-                continue
-
             # --- attribute the shot to a player / team ---
             shooter_id, team_id = self._find_recent_possessor(
                 ball_acquisition, player_assignment, frame_num
@@ -156,13 +182,9 @@ class ShotDetector:
             last_shot_frame = frame_num
 
             # --- resolve made / missed within the resolution window ---
-            made = False
             resolve_end = min(num_frames, frame_num + self.resolution_window)
-            for rf in range(frame_num + 1, resolve_end):
-                ry = self._get_ball_center_y(ball_tracks, rf)
-                if ry is not None and ry < scoring_zone_y:
-                    made = True
-                    break
+            window_y = ball_cy[frame_num + 1:resolve_end]
+            made = bool(np.any((window_y != _NO_BALL_Y) & (window_y < scoring_zone_y)))
 
             shot_results[frame_num] = "made" if made else "missed"
 
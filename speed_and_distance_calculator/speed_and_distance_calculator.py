@@ -6,6 +6,8 @@ using the known court dimensions, and speed is computed over a configurable
 rolling window of frames.
 """
 
+import numpy as np
+
 from utils import measure_distance
 
 
@@ -43,6 +45,9 @@ class SpeedAndDistanceCalculator:
     def calculate_distance(self, tactical_player_positions):
         """Compute per-frame distance for each player from consecutive positions.
 
+        A player's distance on a frame is measured from the last frame the
+        player was seen on, which need not be the previous frame.
+
         Parameters
         ----------
         tactical_player_positions : list[dict]
@@ -53,21 +58,68 @@ class SpeedAndDistanceCalculator:
         list[dict]
             Per-frame mapping of ``player_id → distance_in_metres``.
         """
-        previous_players_position = {}
-        output_distances = []
+        output_distances = [{} for _ in tactical_player_positions]
 
-        for frame_number, frame_positions in enumerate(tactical_player_positions):
-            output_distances.append({})
+        frame_numbers, player_ids, distances = self._distances_per_observation(
+            tactical_player_positions
+        )
+        for frame_number, player_id, meter_distance in zip(
+            frame_numbers.tolist(), player_ids.tolist(), distances.tolist()
+        ):
+            output_distances[frame_number][player_id] = meter_distance
 
-            for player_id, current_pos in frame_positions.items():
-                if player_id in previous_players_position:
-                    prev_pos = previous_players_position[player_id]
-                    meter_distance = self.calculate_meter_distance(prev_pos, current_pos)
-                    output_distances[frame_number][player_id] = meter_distance
+        return output_distances
 
-                previous_players_position[player_id] = current_pos
+    def _distances_per_observation(self, tactical_player_positions):
+        """Vectorised core of :meth:`calculate_distance`.
 
-        return output_distances
+        Every ``(frame, player, x, y)`` observation is flattened into arrays,
+        sorted by player and then frame, so each row's predecessor with the
+        same player id is that player's previous sighting.  All displacements
+        are then converted to metres in one pass.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+            ``(frame_numbers, player_ids, distances)`` for every observation
+            that has an earlier sighting of the same player.
+        """
+        counts = [len(frame_positions) for frame_positions in tactical_player_positions]
+        total = sum(counts)
+
+        frame_numbers = np.repeat(np.arange(len(counts), dtype=np.int64), counts)
+        player_ids = np.fromiter(
+            (pid for frame_positions in tactical_player_positions for pid in frame_positions),
+            dtype=np.int64,
+            count=total,
+        )
+        xy = np.fromiter(
+            (
+                coord
+                for frame_positions in tactical_player_positions
+                for pos in frame_positions.values()
+                for coord in pos[:2]
+            ),
+            dtype=np.float64,
+            count=2 * total,
+        ).reshape(-1, 2)
+
+        order = np.lexsort((frame_numbers, player_ids))
+        frame_numbers = frame_numbers[order]
+        player_ids = player_ids[order]
+        xy = xy[order]
+
+        # Same conversion as calculate_meter_distance, applied to every row at once
+        mx = xy[:, 0] * self.width_in_meters / self.width_in_pixels
+        my = xy[:, 1] * self.height_in_meters / self.height_in_pixels
+        distances = np.sqrt(np.diff(mx) ** 2 + np.diff(my) ** 2) * 0.4
+
+        same_player = player_ids[1:] == player_ids[:-1]
+        return (
+            frame_numbers[1:][same_player],
+            player_ids[1:][same_player],
+            distances[same_player],
+        )
 
     def calculate_meter_distance(self, previous_pixel_position, current_pixel_position):
         """Convert a pixel-space displacement to metres.
@@ -95,6 +147,10 @@ class SpeedAndDistanceCalculator:
         """
         Calculate player speeds based on distances covered over the last 5 frames.
 
+        Each speed uses the player's distances within the trailing 15-frame
+        window and needs at least 5 of them. All windows are evaluated at
+        once from a running sum over each player's observations.
+
         Args:
             distances (list): List of dictionaries containing distance per player per frame,
                             as output by calculate_distance method.
@@ -104,35 +160,64 @@ class SpeedAndDistanceCalculator:
             list: List of dictionaries where each dictionary maps player_id to their
                 speed in km/h at that frame.
         """
-        speeds = []
         window_size = 5
-
-        for frame_idx in range(len(distances)):
-            speeds.append({})
-
-            for player_id in distances[frame_idx].keys():
-                start_frame = max(0, frame_idx - (window_size * 3) + 1)
-
-                total_distance = 0
-                frames_present = 0
-                last_frame_present = None
-
-                for i in range(start_frame, frame_idx + 1):
-                    if player_id in distances[i]:
-                        if last_frame_present is not None:
-                            total_distance += distances[i][player_id]
-                            frames_present += 1
-                        last_frame_present = i
-
-                if frames_present >= window_size:
-                    time_in_seconds = frames_present / fps
-                    time_in_hours = time_in_seconds / 3600
-
-                    if time_in_hours > 0:
-                        speeds[frame_idx][player_id] = (total_distance / 1000) / time_in_hours
-                    else:
-                        speeds[frame_idx][player_id] = 0
-                else:
-                    speeds[frame_idx][player_id] = 0
+        span = window_size * 3
+        num_frames = len(distances)
+        speeds = [{} for _ in range(num_frames)]
+
+        counts = [len(frame_distances) for frame_distances in distances]
+        total = sum(counts)
+        if total == 0:
+            return speeds
+
+        frame_numbers = np.repeat(np.arange(num_frames, dtype=np.int64), counts)
+        player_ids = np.fromiter(
+            (pid for frame_distances in distances for pid in frame_distances),
+            dtype=np.int64,
+            count=total,
+        )
+        values = np.fromiter(
+            (d for frame_distances in distances for d in frame_distances.values()),
+            dtype=np.float64,
+            count=total,
+        )
+
+        # Sort observations by player, then frame, and key them so that every
+        # player's frames occupy a contiguous, ordered range of keys
+        _, columns = np.unique(player_ids, return_inverse=True)
+        keys = columns.astype(np.int64) * num_frames + frame_numbers
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+
+        # For each observation, the first observation of the same player
+        # inside the window [frame - span + 1, frame]
+        window_start = np.maximum(frame_numbers[order] - span + 1, 0)
+        first = np.searchsorted(keys, keys - frame_numbers[order] + window_start)
+        last = np.arange(total)
+
+        # The first sighting in the window has no predecessor inside it, so
+        # its distance is left out of both the total and the frame count
+        prefix = np.concatenate(([0.0], np.cumsum(values[order])))
+        total_distance = prefix[last + 1] - prefix[first + 1]
+        frames_present = last - first
+
+        time_in_hours = frames_present / fps / 3600
+        valid = (frames_present >= window_size) & (time_in_hours > 0)
+        speed = np.zeros(total)
+        speed[valid] = (total_distance[valid] / 1000) / time_in_hours[valid]
+
+        # Scatter back to the original observation order
+        speed_by_observation = np.empty_like(speed)
+        speed_by_observation[order] = speed
+        valid_by_observation = np.empty_like(valid)
+        valid_by_observation[order] = valid
+
+        for frame_idx, player_id, player_speed, ok in zip(
+            frame_numbers.tolist(),
+            player_ids.tolist(),
+            speed_by_observation.tolist(),
+            valid_by_observation.tolist(),
+        ):
+            speeds[frame_idx][player_id] = player_speed if ok else 0
 
         return speeds
@@ -1,3 +1,3 @@
-from .tactical_view_converter import TacticalViewConverter
+from .tactical_view_converter import TacticalViewConverter, pack_player_positions
 
-__all__ = ["TacticalViewConverter"]
+__all__ = ["TacticalViewConverter", "pack_player_positions"]
@@ -57,6 +57,8 @@ class Homography:
         if points.shape[1] != 2:
             raise ValueError("Points must be 2D coordinates.")
 
-        points = points.reshape(-1, 1, 2).astype(np.float32)
+        # asarray only copies when the input is not float32 already, and
+        # perspectiveTransform returns float32 for float32 input
+        points = np.asarray(points, dtype=np.float32).reshape(-1, 1, 2)
         points = cv2.perspectiveTransform(points, self.m)
-        return points.reshape(-1, 2).astype(np.float32)
+        return points.reshape(-1, 2)
@@ -7,14 +7,15 @@ computes per-frame homographies to project player foot-positions into the
 tactical coordinate system.
 """
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 
 import numpy as np
 import cv2
 
 from .homography import Homography
-from utils import get_foot_position, measure_distance
-
+from utils import get_foot_position
 
 class TacticalViewConverter:
     """Convert player positions from camera view to a bird's-eye tactical view.
@@ -75,6 +76,11 @@ class TacticalViewConverter:
             ),
         ]
 
+        # The canonical keypoints never change: keep them as an array for
+        # building homographies, along with their squared pairwise distances
+        self._key_points_np = np.asarray(self.key_points, dtype=np.float32)
+        self._key_point_sq_distances = _pairwise_sq_distances(self.key_points).tolist()
+
     # ------------------------------------------------------------------
     # Keypoint validation
     # ------------------------------------------------------------------
@@ -92,26 +98,38 @@ class TacticalViewConverter:
 
         Returns:
             List[bool]: A list indicating whether each frame's keypoints are valid.
+
+        The input is never modified.  Frames with an invalidated keypoint are
+        copies with that keypoint zeroed; all other entries are the input's
+        own frame objects.
         """
-        keypoints_list = deepcopy(keypoints_list)
+        # Only frames that actually lose a keypoint are copied (on their first
+        # invalidation); every other frame is shared with the input list
+        keypoints_list = list(keypoints_list)
 
-        for frame_idx, frame_keypoints in enumerate(keypoints_list):
-            frame_keypoints = frame_keypoints.xy.tolist()[0]
+        tactical_sq_distances = self._key_point_sq_distances
 
-            detected_indices = [
-                i for i, kp in enumerate(frame_keypoints) if kp[0] > 0 and kp[1] > 0
-            ]
+        # With r = (d_ij / d_ik) / (t_ij / t_ik), the 80 % error margin
+        # |r - 1| > 0.8 is checked on r² so that no square root is needed
+        max_ratio_sq = (1 + 0.8) ** 2
+        min_ratio_sq = (1 - 0.8) ** 2
+
+        for frame_idx, frame_keypoints in enumerate(keypoints_list):
+            frame_points = _keypoints_xy(frame_keypoints)
+            detected_indices = np.flatnonzero(
+                (frame_points[:, 0] > 0) & (frame_points[:, 1] > 0)
+            ).tolist()
 
             # Need at least 3 detected keypoints to validate proportions
             if len(detected_indices) < 3:
                 continue
 
+            # Plain floats keep the scalar distance maths below cheap
+            frame_keypoints = frame_points.tolist()
+
             invalid_keypoints = []
 
             for i in detected_indices:
-                if frame_keypoints[i][0] == 0 and frame_keypoints[i][1] == 0:
-                    continue
-
                 other_indices = [
                     idx
                     for idx in detected_indices
@@ -123,18 +141,25 @@ class TacticalViewConverter:
                 j, k = other_indices[0], other_indices[1]
 
                 # Proportional-distance check between detected and tactical keypoints
-                d_ij = measure_distance(frame_keypoints[i], frame_keypoints[j])
-                d_ik = measure_distance(frame_keypoints[i], frame_keypoints[k])
-                t_ij = measure_distance(self.key_points[i], self.key_points[j])
-                t_ik = measure_distance(self.key_points[i], self.key_points[k])
-
-                if t_ij > 0 and t_ik > 0:
-                    prop_detected = d_ij / d_ik if d_ik > 0 else float("inf")
-                    prop_tactical = t_ij / t_ik if t_ik > 0 else float("inf")
-
-                    error = abs((prop_detected - prop_tactical) / prop_tactical)
-
-                    if error > 0.8:  # 80 % error margin → invalidate
+                t2_ij = tactical_sq_distances[i][j]
+                t2_ik = tactical_sq_distances[i][k]
+
+                if t2_ij > 0 and t2_ik > 0:
+                    xi, yi = frame_keypoints[i]
+                    xj, yj = frame_keypoints[j]
+                    xk, yk = frame_keypoints[k]
+                    d2_ij = (xi - xj) ** 2 + (yi - yj) ** 2
+                    d2_ik = (xi - xk) ** 2 + (yi - yk) ** 2
+
+                    if d2_ik > 0:
+                        ratio_sq = (d2_ij * t2_ik) / (d2_ik * t2_ij)
+                        out_of_margin = ratio_sq > max_ratio_sq or ratio_sq < min_ratio_sq
+                    else:
+                        out_of_margin = True  # infinite detected proportion
+
+                    if out_of_margin:  # 80 % error margin → invalidate
+                        if not invalid_keypoints:
+                            keypoints_list[frame_idx] = deepcopy(keypoints_list[frame_idx])
                         keypoints_list[frame_idx].xy[0][i] *= 0
                         keypoints_list[frame_idx].xyn[0][i] *= 0
                         invalid_keypoints.append(i)
@@ -145,62 +170,213 @@ class TacticalViewConverter:
     # Homography-based projection
     # ------------------------------------------------------------------
 
-    def transform_players_to_tactical_view(self, keypoints_list, player_tracks):
+    def transform_players_to_tactical_view(self, keypoints_list, player_tracks, workers=1):
         """
         Transform player positions from video frame coordinates to tactical view coordinates.
 
+        Frames are independent, so with ``workers > 1`` the video is split into
+        contiguous chunks that are projected in parallel worker processes and
+        merged in order.  Spawned workers re-import the calling script and
+        everything it imports, which for this pipeline costs more than
+        projecting thousands of frames in process, hence the default of one.
+
         Args:
             keypoints_list (list): List of detected court keypoints for each frame.
             player_tracks (list): List of dictionaries containing player tracking information for each frame,
                 where each dictionary maps player IDs to their bounding box coordinates.
+            workers (int, optional): Number of worker processes. Defaults to ``1``,
+                which projects every frame in the calling process.
 
         Returns:
             list: List of dictionaries where each dictionary maps player IDs to their (x, y) positions
                 in the tactical view coordinate system. The list index corresponds to the frame number.
         """
-        tactical_player_positions = []
+        # Reduce each frame to an array and plain bboxes so chunks are cheap
+        # to send to workers
+        frame_keypoints = []
+        frame_bboxes = []
+        for keypoints, tracks in zip(keypoints_list, player_tracks):
+            frame_keypoints.append(_keypoints_xy(keypoints))
+            frame_bboxes.append(
+                {player_id: player_data["bbox"] for player_id, player_data in tracks.items()}
+            )
 
-        for frame_idx, (frame_keypoints, frame_tracks) in enumerate(
-            zip(keypoints_list, player_tracks)
-        ):
-            tactical_positions = {}
-            frame_keypoints = frame_keypoints.xy.tolist()[0]
+        num_frames = len(frame_keypoints)
+        workers = min(workers, num_frames)
 
-            if frame_keypoints is None or len(frame_keypoints) == 0:
-                tactical_player_positions.append(tactical_positions)
-                continue
+        if workers <= 1:
+            return _project_frames(
+                self._key_points_np, self.width, self.height, frame_keypoints, frame_bboxes
+            )
 
-            valid_indices = [
-                i for i, kp in enumerate(frame_keypoints) if kp[0] > 0 and kp[1] > 0
+        chunk_size = -(-num_frames // workers)
+        # spawn rather than fork: the pipeline has model and I/O threads running
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            futures = [
+                pool.submit(
+                    _project_frames,
+                    self._key_points_np,
+                    self.width,
+                    self.height,
+                    frame_keypoints[i:i + chunk_size],
+                    frame_bboxes[i:i + chunk_size],
+                )
+                for i in range(0, num_frames, chunk_size)
             ]
+            tactical_player_positions = []
+            for future in futures:
+                tactical_player_positions.extend(future.result())
 
-            # A minimum of 4 point-pairs is required for a reliable homography
-            if len(valid_indices) < 4:
-                tactical_player_positions.append(tactical_positions)
-                continue
+        return tactical_player_positions
 
-            source_points = np.array(
-                [frame_keypoints[i] for i in valid_indices], dtype=np.float32
-            )
-            target_points = np.array(
-                [self.key_points[i] for i in valid_indices], dtype=np.float32
-            )
 
-            try:
-                homography = Homography(source_points, target_points)
+def _keypoints_xy(frame_keypoints):
+    """Return a frame's court keypoints as an ``(N, 2)`` float32 array.
 
-                for player_id, player_data in frame_tracks.items():
-                    bbox = player_data["bbox"]
-                    player_position = np.array([get_foot_position(bbox)])
-                    tactical_position = homography.transform_points(player_position)
+    Accepts keypoint results whose ``xy`` is either a NumPy array or a
+    (possibly GPU) torch tensor.
+    """
+    xy = frame_keypoints.xy
+    if hasattr(xy, "cpu"):
+        xy = xy.cpu().numpy()
+    return np.asarray(xy[0], dtype=np.float32)
+
+
+def _pairwise_sq_distances(points):
+    """Return the ``(N, N)`` matrix of squared Euclidean distances between 2-D *points*."""
+    points = np.asarray(points, dtype=np.float64)
+    deltas = points[:, None, :] - points[None, :, :]
+    return deltas[..., 0] ** 2 + deltas[..., 1] ** 2
+
+
+def _project_frames(key_points, width, height, frame_keypoints, frame_bboxes):
+    """Project the players of consecutive frames into the tactical view.
+
+    Module-level so that it can run in a worker process.  A run of
+    consecutive frames solves for its homography only once when the detected
+    keypoints round to the same values at 0.1 px.  The reuse is therefore
+    approximate: a frame whose keypoints drifted by less than that rounding
+    step (e.g. 0.03 px) is projected with the previous frame's homography,
+    which moves projected positions by a comparably tiny amount.
+
+    Args:
+        key_points (numpy.ndarray): ``(18, 2)`` float32 tactical-view reference keypoints.
+        width (int): Width of the tactical view.
+        height (int): Height of the tactical view.
+        frame_keypoints (list): Per-frame ``(N, 2)`` float32 arrays of detected court keypoints.
+        frame_bboxes (list): Per-frame dictionaries mapping player IDs to bounding boxes.
+
+    Returns:
+        list: Per-frame dictionaries mapping player IDs to tactical ``[x, y]`` positions.
+    """
+    tactical_player_positions = []
 
-                    tx, ty = tactical_position[0]
-                    if 0 <= tx <= self.width and 0 <= ty <= self.height:
-                        tactical_positions[player_id] = tactical_position[0].tolist()
+    # Homography of the last frame that needed one, keyed by its keypoints
+    cached_signature = None
+    cached_homography = None
 
-            except (ValueError, cv2.error):
-                pass  # Homography failed — leave this frame empty
+    for keypoints, bboxes in zip(frame_keypoints, frame_bboxes):
+        tactical_positions = {}
 
+        if keypoints is None or len(keypoints) == 0:
             tactical_player_positions.append(tactical_positions)
+            continue
 
-        return tactical_player_positions
+        valid_indices = np.flatnonzero((keypoints[:, 0] > 0) & (keypoints[:, 1] > 0))
+
+        # A minimum of 4 point-pairs is required for a reliable homography
+        if len(valid_indices) < 4:
+            tactical_player_positions.append(tactical_positions)
+            continue
+
+        source_points = keypoints[valid_indices]
+
+        # Consecutive frames whose keypoints round to the same 0.1 px values
+        # reuse the previous homography instead of solving for it again; this
+        # tolerance is deliberate (see the docstring)
+        signature = (valid_indices.tobytes(), np.round(source_points, 1).tobytes())
+
+        try:
+            if signature != cached_signature:
+                cached_signature, cached_homography = signature, None
+                cached_homography = Homography(source_points, key_points[valid_indices])
+            homography = cached_homography
+
+            # Project every player of the frame in one call
+            player_ids = list(bboxes.keys())
+            if homography is not None and player_ids:
+                player_positions = np.array(
+                    [get_foot_position(bboxes[pid]) for pid in player_ids],
+                    dtype=np.float32,
+                )
+                projected = homography.transform_points(player_positions)
+                in_view = (
+                    (projected[:, 0] >= 0)
+                    & (projected[:, 0] <= width)
+                    & (projected[:, 1] >= 0)
+                    & (projected[:, 1] <= height)
+                )
+                for player_id, position, visible in zip(
+                    player_ids, projected.tolist(), in_view.tolist()
+                ):
+                    if visible:
+                        tactical_positions[player_id] = position
+
+        except (ValueError, cv2.error):
+            pass  # Homography failed — leave this frame empty
+
+        tactical_player_positions.append(tactical_positions)
+
+    return tactical_player_positions
+
+
+def pack_player_positions(tactical_player_positions, player_assignment=None, default_team_id=1):
+    """Flatten per-frame tactical positions into contiguous parallel arrays.
+
+    Parameters
+    ----------
+    tactical_player_positions : list[dict]
+        Per-frame mapping of ``player_id → (x, y)`` as returned by
+        :meth:`TacticalViewConverter.transform_players_to_tactical_view`.
+    player_assignment : list[dict] | None
+        Per-frame ``{player_id: team_id}`` mappings used to fill ``team_id``.
+    default_team_id : int
+        Team used for players missing from ``player_assignment``.
+
+    Returns
+    -------
+    dict
+        ``{"num_frames": int, "frame_index": int32[N], "player_id": int32[N],
+        "team_id": int32[N], "xy": float32[N, 2]}`` with one row per
+        (frame, player) pair, ordered by frame.
+    """
+    player_assignment = player_assignment or []
+    counts = [len(frame_positions) for frame_positions in tactical_player_positions]
+    total = sum(counts)
+
+    frame_index = np.repeat(
+        np.arange(len(tactical_player_positions), dtype=np.int32), counts
+    )
+    player_id = np.empty(total, dtype=np.int32)
+    team_id = np.empty(total, dtype=np.int32)
+    xy = np.empty((total, 2), dtype=np.float32)
+
+    row = 0
+    for frame_idx, frame_positions in enumerate(tactical_player_positions):
+        frame_assignments = (
+            player_assignment[frame_idx] if frame_idx < len(player_assignment) else {}
+        )
+        for pid, position in frame_positions.items():
+            player_id[row] = pid
+            team_id[row] = frame_assignments.get(pid, default_team_id)
+            xy[row] = position
+            row += 1
+
+    return {
+        "num_frames": len(tactical_player_positions),
+        "frame_index": frame_index,
+        "player_id": player_id,
+        "team_id": team_id,
+        "xy": xy,
+    }
@@ -0,0 +1,30 @@
+"""Regression tests for :class:`shot_detector.ShotDetector`."""
+
+from shot_detector import ShotDetector
+
+
+def _ball_track(ys):
+    return [{1: {"bbox": [100, y - 5, 110, y + 5]}} for y in ys]
+
+
+def test_clip_shorter_than_lookback_has_no_shots():
+    detector = ShotDetector()
+    for num_frames in range(0, detector.lookback_frames + 1):
+        ball_tracks = _ball_track([500 - 40 * i for i in range(num_frames)])
+        shot_frames, shot_results, shot_team = detector.detect_shots(
+            ball_tracks, [3] * num_frames, [{3: 1}] * num_frames, 1080
+        )
+        assert shot_frames == [-1] * num_frames
+        assert shot_results == [None] * num_frames
+        assert shot_team == [-1] * num_frames
+
+
+def test_upward_ball_after_lookback_is_a_shot():
+    detector = ShotDetector()
+    num_frames = detector.lookback_frames + 4
+    ys = [900] * detector.lookback_frames + [100] * 4
+    shot_frames, shot_results, _ = detector.detect_shots(
+        _ball_track(ys), [3] * num_frames, [{3: 1}] * num_frames, 1080
+    )
+    assert shot_frames[detector.lookback_frames] == 1
+    assert shot_results[detector.lookback_frames] in ("made", "missed")
@@ -0,0 +1,15 @@
+"""Regression tests for :func:`utils.read_video`."""
+
+import numpy as np
+
+from utils import read_video, save_video
+
+
+def test_read_video_allocates_exactly_the_frames_read(tmp_path):
+    path = str(tmp_path / "clip.avi")
+    save_video(iter([np.full((32, 32, 3), 10 * i, np.uint8) for i in range(10)]), path, fps=10)
+
+    frames = read_video(path)
+
+    assert len(frames) == 10
+    assert frames[0].base.shape[0] == 10
@@ -1,4 +1,15 @@
-from .player_tracker import PlayerTracker
+from .player_tracker import (
+    PlayerTracker,
+    pack_player_tracks,
+    frame_player_tracks,
+    unpack_player_tracks,
+)
 from .ball_tracker import BallTracker
 
-__all__ = ["PlayerTracker", "BallTracker"]
+__all__ = [
+    "PlayerTracker",
+    "BallTracker",
+    "pack_player_tracks",
+    "frame_player_tracks",
+    "unpack_player_tracks",
+]
@@ -6,12 +6,13 @@ reduced to keeping the highest-confidence detection. Post-processing steps
 remove outlier detections and interpolate gaps to produce a smooth trajectory.
 """
 
-from ultralytics import YOLO
+import math
+
 import supervision as sv
 import numpy as np
-import pandas as pd
 
 from utils import read_stub, save_stub
+from utils.model_utils import load_yolo_model, iter_predictions
 
 
 class BallTracker:
@@ -23,8 +24,8 @@ class BallTracker:
         The YOLO detection model trained to detect the ball.
     """
 
-    def __init__(self, model_path):
-        self.model = YOLO(model_path)
+    def __init__(self, model_path, calibration_frames=None):
+        self.model = load_yolo_model(model_path, calibration_frames=calibration_frames)
 
     # ------------------------------------------------------------------
     # Detection
@@ -40,12 +41,22 @@ class BallTracker:
         Returns:
             list: YOLO detection results for each frame.
         """
-        batch_size = 20
-        detections = []
-        for i in range(0, len(frames), batch_size):
-            detections_batch = self.model.predict(frames[i : i + batch_size], conf=0.5)
-            detections += detections_batch
-        return detections
+        return list(self.iter_detections(frames))
+
+    def iter_detections(self, frames):
+        """
+        Lazily detect ball in a sequence of frames.
+
+        Batches are predicted on a worker thread, so the next batch is already
+        running while the caller processes the current frame's results.
+
+        Args:
+            frames (list): List of video frames to process.
+
+        Yields:
+            ultralytics.engine.results.Results: The detection result of each frame.
+        """
+        return iter_predictions(self.model, frames, conf=0.5, half=True)
 
     # ------------------------------------------------------------------
     # Tracking
@@ -67,30 +78,30 @@ class BallTracker:
         if tracks is not None and len(tracks) == len(frames):
             return tracks
 
-        detections = self.detect_frames(frames)
+        detections = self.iter_detections(frames)
         tracks = []
 
+        # Every result shares the model's class names, so the id is looked up once
+        ball_cls_id = None
+
         for frame_num, detection in enumerate(detections):
-            cls_names = detection.names
-            cls_names_inv = {v: k for k, v in cls_names.items()}
+            if ball_cls_id is None:
+                ball_cls_id = {v: k for k, v in detection.names.items()}["Ball"]
 
             detection_supervision = sv.Detections.from_ultralytics(detection)
 
             tracks.append({})
-            chosen_bbox = None
-            max_confidence = 0
-
-            for frame_detection in detection_supervision:
-                bbox = frame_detection[0].tolist()
-                cls_id = frame_detection[3]
-                confidence = frame_detection[2]
 
-                if cls_id == cls_names_inv["Ball"] and confidence > max_confidence:
-                    chosen_bbox = bbox
-                    max_confidence = confidence
-
-            if chosen_bbox is not None:
-                tracks[frame_num][1] = {"bbox": chosen_bbox}
+            # Keep the most confident ball (the first one on ties)
+            ball_confidences = np.where(
+                detection_supervision.class_id == ball_cls_id,
+                detection_supervision.confidence,
+                0,
+            )
+            if len(ball_confidences):
+                best = int(np.argmax(ball_confidences))
+                if ball_confidences[best] > 0:
+                    tracks[frame_num][1] = {"bbox": detection_supervision.xyxy[best].tolist()}
 
         save_stub(stub_path, tracks)
         return tracks
@@ -109,49 +120,112 @@ class BallTracker:
         Returns:
             list: Filtered ball positions with incorrect detections removed.
         """
+        bboxes = _bbox_array(ball_positions)
+        for i in self._wrong_detection_frames(bboxes):
+            ball_positions[i] = {}
+        return ball_positions
+
+    def interpolate_ball_positions(self, ball_positions):
+        """
+        Interpolate missing ball positions to create smooth tracking results.
+
+        Args:
+            ball_positions (list): List of ball positions with potential gaps.
+
+        Returns:
+            list: List of ball positions with interpolated values filling the gaps.
+        """
+        return _tracks_from_bboxes(_interpolate_bboxes(_bbox_array(ball_positions)))
+
+    def clean_ball_positions(self, ball_positions):
+        """
+        Remove wrong detections and interpolate the gaps in one pass.
+
+        Equivalent to ``interpolate_ball_positions(remove_wrong_detections(...))``
+        but the track is converted to an array once and back once, and the
+        input list is left untouched.
+
+        Args:
+            ball_positions (list): List of detected ball positions across frames.
+
+        Returns:
+            list: Filtered ball positions with the gaps interpolated.
+        """
+        bboxes = _bbox_array(ball_positions)
+        bboxes[self._wrong_detection_frames(bboxes)] = np.nan
+        return _tracks_from_bboxes(_interpolate_bboxes(bboxes))
+
+    def _wrong_detection_frames(self, bboxes):
+        """
+        Return the frames whose detection jumps too far from the last good one.
+
+        Args:
+            bboxes (numpy.ndarray): ``(F, 4)`` boxes, ``NaN`` rows where missing.
+
+        Returns:
+            list: Indices of the frames to discard.
+        """
         maximum_allowed_distance = 25
         last_good_frame_index = -1
+        last_x = last_y = 0.0
+        wrong_frames = []
 
-        for i in range(len(ball_positions)):
-            current_box = ball_positions[i].get(1, {}).get("bbox", [])
-            if len(current_box) == 0:
+        for i, (x, y) in enumerate(bboxes[:, :2].tolist()):
+            if math.isnan(x):
                 continue
 
             if last_good_frame_index == -1:
                 last_good_frame_index = i
+                last_x, last_y = x, y
                 continue
 
-            last_good_box = ball_positions[last_good_frame_index].get(1, {}).get("bbox", [])
             frame_gap = i - last_good_frame_index
             adjusted_max_distance = maximum_allowed_distance * frame_gap
 
-            distance = np.linalg.norm(
-                np.array(last_good_box[:2]) - np.array(current_box[:2])
-            )
+            # Scalar distance between top-left corners; no temporary arrays
+            distance = math.hypot(last_x - x, last_y - y)
             if distance > adjusted_max_distance:
-                ball_positions[i] = {}
+                wrong_frames.append(i)
             else:
                 last_good_frame_index = i
+                last_x, last_y = x, y
 
-        return ball_positions
+        return wrong_frames
 
-    def interpolate_ball_positions(self, ball_positions):
-        """
-        Interpolate missing ball positions to create smooth tracking results.
 
-        Args:
-            ball_positions (list): List of ball positions with potential gaps.
+# ----------------------------------------------------------------------
+# Array form of a ball track
+# ----------------------------------------------------------------------
 
-        Returns:
-            list: List of ball positions with interpolated values filling the gaps.
-        """
-        raw = [x.get(1, {}).get("bbox", []) for x in ball_positions]
-        df_ball_positions = pd.DataFrame(raw, columns=["x1", "y1", "x2", "y2"])
+def _bbox_array(ball_positions):
+    """Return the ball boxes as an ``(F, 4)`` float64 array, ``NaN`` where missing."""
+    missing = [np.nan] * 4
+    return np.array(
+        [x.get(1, {}).get("bbox") or missing for x in ball_positions],
+        dtype=np.float64,
+    ).reshape(-1, 4)
 
-        df_ball_positions = df_ball_positions.interpolate()
-        df_ball_positions = df_ball_positions.bfill()
 
-        ball_positions = [
-            {1: {"bbox": row}} for row in df_ball_positions.to_numpy().tolist()
-        ]
-        return ball_positions
+def _interpolate_bboxes(bboxes):
+    """Fill the ``NaN`` rows of *bboxes* in place and return it.
+
+    Linear in the frame index between detections; ``np.interp`` holds the
+    first / last detection constant beyond either end (bfill / ffill).
+    Without any detection the array is returned unchanged.
+    """
+    known = np.flatnonzero(~np.isnan(bboxes).any(axis=1))
+    if len(known) == 0:
+        return bboxes
+
+    frame_indices = np.arange(len(bboxes))
+    for column in range(4):
+        bboxes[:, column] = np.interp(frame_indices, known, bboxes[known, column])
+    return bboxes
+
+
+def _tracks_from_bboxes(bboxes):
+    """Convert a box array back to per-frame track dicts, ``{}`` for ``NaN`` rows."""
+    return [
+        {} if math.isnan(row[0]) else {1: {"bbox": row}}
+        for row in bboxes.tolist()
+    ]
@@ -4,12 +4,22 @@ Player detection and multi-object tracking using YOLO + ByteTrack.
 The :class:`PlayerTracker` combines YOLO object-detection with Supervision's
 ByteTrack algorithm so that every detected player receives a stable track ID
 that persists across frames.
+
+Tracks are handed around as one ``{track_id: {"bbox": [...]}}`` dict per
+frame.  :func:`pack_player_tracks` flattens them into parallel arrays with a
+per-frame offset index, which is how they are stored in the stub.
 """
 
-from ultralytics import YOLO
+import itertools
+
+import numpy as np
 import supervision as sv
 
 from utils import read_stub, save_stub
+from utils.model_utils import load_yolo_model, iter_predictions
+
+# Detections below this confidence are dropped by the model
+_DETECTION_CONFIDENCE = 0.5
 
 
 class PlayerTracker:
@@ -23,64 +33,102 @@ class PlayerTracker:
         The ByteTrack multi-object tracker.
     """
 
-    def __init__(self, model_path):
+    def __init__(self, model_path, calibration_frames=None, frame_rate=24):
         """
         Initialize the PlayerTracker with YOLO model and ByteTrack tracker.
 
         Args:
-            model_path (str): Path to the YOLO model weights.
+            model_path (str): Path to the YOLO model weights, or to an exported
+                TensorRT ``.engine``.
+            calibration_frames (list, optional): Frames to calibrate an INT8
+                TensorRT engine on; ``None`` builds the FP16 engine.
+            frame_rate (float): Rate at which the tracker is updated, i.e. the
+                video fps divided by the detection stride.  ByteTrack scales
+                its lost-track buffer by it.
         """
-        self.model = YOLO(model_path)
-        self.tracker = sv.ByteTrack()
+        self.model = load_yolo_model(model_path, calibration_frames=calibration_frames)
+        # ByteTrack only starts a track above track_activation_threshold + 0.1,
+        # so the threshold sits 0.1 below the detector's confidence cut-off to
+        # let every kept detection start one.  A shorter lost-track buffer
+        # keeps fewer stale Kalman tracks in the matching for ~10 players.
+        self.tracker = sv.ByteTrack(
+            track_activation_threshold=_DETECTION_CONFIDENCE - 0.1,
+            minimum_matching_threshold=0.8,
+            lost_track_buffer=15,
+            frame_rate=max(1, round(frame_rate)),
+        )
 
     # ------------------------------------------------------------------
     # Detection
     # ------------------------------------------------------------------
 
-    def detect_frames(self, frames):
+    def detect_frames(self, frames, stride=1):
         """
         Detect players in a sequence of frames using batch processing.
 
         Args:
             frames (list): List of video frames to process.
+            stride (int): Only every ``stride``-th frame is run through the model.
 
         Returns:
-            list: YOLO detection results for each frame.
+            list: YOLO detection results for each processed frame.
+        """
+        return list(self.iter_detections(frames, stride))
+
+    def iter_detections(self, frames, stride=1):
+        """
+        Lazily detect players in a sequence of frames.
+
+        Batches are predicted on a worker thread, so the next batch is already
+        running while the caller processes the current frame's results.
+
+        Args:
+            frames (list): List of video frames to process.
+            stride (int): Only every ``stride``-th frame is run through the model.
+
+        Yields:
+            ultralytics.engine.results.Results: The detection result of each processed frame.
         """
-        batch_size = 20
-        detections = []
-        for i in range(0, len(frames), batch_size):
-            detections_batch = self.model.predict(frames[i : i + batch_size], conf=0.5)
-            detections += detections_batch
-        return detections
+        keyframes = itertools.islice(frames, 0, None, stride)
+        return iter_predictions(self.model, keyframes, conf=_DETECTION_CONFIDENCE, half=True)
 
     # ------------------------------------------------------------------
     # Tracking
     # ------------------------------------------------------------------
 
-    def get_object_tracks(self, frames, read_from_stub=False, stub_path=None):
+    def get_object_tracks(self, frames, read_from_stub=False, stub_path=None, stride=1):
         """
         Get player tracking results for a sequence of frames with optional caching.
 
+        With ``stride > 1`` only every ``stride``-th frame is detected and
+        tracked; players seen on both surrounding keyframes are linearly
+        interpolated on the frames in between.
+
         Args:
             frames (list): List of video frames to process.
             read_from_stub (bool): Whether to attempt reading cached results.
             stub_path (str): Path to the cache file.
+            stride (int): Distance between detected keyframes.
 
         Returns:
             list: List of dictionaries containing player tracking information for each frame,
                 where each dictionary maps player IDs to their bounding box coordinates.
         """
         tracks = read_stub(read_from_stub, stub_path)
+        if isinstance(tracks, dict):
+            tracks = unpack_player_tracks(tracks)
         if tracks is not None and len(tracks) == len(frames):
             return tracks
 
-        detections = self.detect_frames(frames)
+        detections = self.iter_detections(frames, stride)
         tracks = []
 
+        # Every result shares the model's class names, so the id is looked up once
+        player_cls_id = None
+
         for frame_num, detection in enumerate(detections):
-            cls_names = detection.names
-            cls_names_inv = {v: k for k, v in cls_names.items()}
+            if player_cls_id is None:
+                player_cls_id = {v: k for k, v in detection.names.items()}["Player"]
 
             # Convert to Supervision Detection format
             detection_supervision = sv.Detections.from_ultralytics(detection)
@@ -88,14 +136,154 @@ class PlayerTracker:
             # Update tracker with current-frame detections
             detection_with_tracks = self.tracker.update_with_detections(detection_supervision)
 
-            tracks.append({})
-            for frame_detection in detection_with_tracks:
-                bbox = frame_detection[0].tolist()
-                cls_id = frame_detection[3]
-                track_id = frame_detection[4]
+            is_player = detection_with_tracks.class_id == player_cls_id
+            tracks.append({
+                track_id: {"bbox": bbox}
+                for bbox, track_id in zip(
+                    detection_with_tracks.xyxy[is_player].tolist(),
+                    detection_with_tracks.tracker_id[is_player].tolist(),
+                )
+            })
 
-                if cls_id == cls_names_inv["Player"]:
-                    tracks[frame_num][track_id] = {"bbox": bbox}
+        if stride > 1:
+            tracks = _fill_skipped_frames(tracks, stride, len(frames))
 
-        save_stub(stub_path, tracks)
+        save_stub(stub_path, pack_player_tracks(tracks))
         return tracks
+
+
+def _fill_skipped_frames(keyframe_tracks, stride, num_frames):
+    """Expand keyframe tracks to every frame by linear interpolation.
+
+    Parameters
+    ----------
+    keyframe_tracks : list[dict]
+        Tracks of frames ``0, stride, 2 * stride, ...``.
+    stride : int
+        Distance between keyframes.
+    num_frames : int
+        Total number of frames.
+
+    Returns
+    -------
+    list[dict]
+        Per-frame tracks. A player appears on a skipped frame only if it is
+        tracked on both surrounding keyframes; frames after the last keyframe
+        repeat its tracks.
+    """
+    tracks = [{} for _ in range(num_frames)]
+
+    for key_index, (start, end) in enumerate(
+        zip(keyframe_tracks, keyframe_tracks[1:] + [None])
+    ):
+        key_frame = key_index * stride
+        tracks[key_frame] = start
+
+        for offset in range(1, min(stride, num_frames - key_frame)):
+            if end is None:
+                tracks[key_frame + offset] = dict(start)
+                continue
+
+            t = offset / stride
+            tracks[key_frame + offset] = {
+                track_id: {
+                    "bbox": [
+                        a + (b - a) * t
+                        for a, b in zip(info["bbox"], end[track_id]["bbox"])
+                    ]
+                }
+                for track_id, info in start.items()
+                if track_id in end
+            }
+
+    return tracks
+
+
+# ----------------------------------------------------------------------
+# Packed (structure-of-arrays) form
+# ----------------------------------------------------------------------
+
+def pack_player_tracks(player_tracks):
+    """Flatten per-frame player tracks into contiguous parallel arrays.
+
+    Parameters
+    ----------
+    player_tracks : list[dict]
+        Per-frame ``{track_id: {"bbox": [x1, y1, x2, y2]}}`` mappings as
+        returned by :meth:`PlayerTracker.get_object_tracks`.
+
+    Returns
+    -------
+    dict
+        ``{"frame_offsets": int32[F + 1], "track_id": int32[N],
+        "bbox": float64[N, 4]}`` with one row per (frame, player) pair,
+        ordered by frame; the rows of frame ``f`` are
+        ``frame_offsets[f]:frame_offsets[f + 1]``.
+    """
+    counts = [len(frame_tracks) for frame_tracks in player_tracks]
+    frame_offsets = np.zeros(len(player_tracks) + 1, dtype=np.int32)
+    np.cumsum(counts, out=frame_offsets[1:])
+
+    total = int(frame_offsets[-1])
+    track_id = np.fromiter(
+        (tid for frame_tracks in player_tracks for tid in frame_tracks),
+        dtype=np.int32,
+        count=total,
+    )
+    bbox = np.array(
+        [info["bbox"] for frame_tracks in player_tracks for info in frame_tracks.values()],
+        # float64 keeps interpolated boxes exact, so a stub reloads unchanged
+        dtype=np.float64,
+    ).reshape(total, 4)
+
+    return {"frame_offsets": frame_offsets, "track_id": track_id, "bbox": bbox}
+
+
+def frame_player_tracks(packed_tracks, frame_num):
+    """Return the ``{track_id: {"bbox": [...]}}`` view of one packed frame.
+
+    Parameters
+    ----------
+    packed_tracks : dict
+        Arrays as returned by :func:`pack_player_tracks`.
+    frame_num : int
+        Index of the frame.
+
+    Returns
+    -------
+    dict
+        The frame's tracks in the per-frame dict format.
+    """
+    start, end = packed_tracks["frame_offsets"][frame_num : frame_num + 2].tolist()
+    return {
+        tid: {"bbox": bbox}
+        for tid, bbox in zip(
+            packed_tracks["track_id"][start:end].tolist(),
+            packed_tracks["bbox"][start:end].tolist(),
+        )
+    }
+
+
+def unpack_player_tracks(packed_tracks):
+    """Rebuild the per-frame dict list from :func:`pack_player_tracks` arrays.
+
+    Parameters
+    ----------
+    packed_tracks : dict
+        Arrays as returned by :func:`pack_player_tracks`.
+
+    Returns
+    -------
+    list[dict]
+        Per-frame ``{track_id: {"bbox": [x1, y1, x2, y2]}}`` mappings.
+    """
+    offsets = packed_tracks["frame_offsets"].tolist()
+    track_ids = packed_tracks["track_id"].tolist()
+    bboxes = packed_tracks["bbox"].tolist()
+    return [
+        {
+            track_ids[row]: {"bbox": bboxes[row]}
+            for row in range(offsets[frame_num], offsets[frame_num + 1])
+        }
+        for frame_num in range(len(offsets) - 1)
+    ]
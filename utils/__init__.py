@@ -11,17 +11,31 @@ from .bbox_utils import (
     get_bbox_width,
     get_foot_position,
     measure_distance,
+    measure_distance_sq,
+    get_center_of_bbox_batch,
+    get_bbox_width_batch,
+    get_foot_position_batch,
+    measure_distance_batch,
 )
-from .video_utils import read_video, save_video
-from .stub_utils import read_stub, save_stub
+from .video_utils import read_video, iter_video, save_video, get_video_fps
+from .stub_utils import read_stub, save_stub, file_cache_key, stage_cache_key
 
 __all__ = [
     "get_center_of_bbox",
     "get_bbox_width",
     "get_foot_position",
     "measure_distance",
+    "measure_distance_sq",
+    "get_center_of_bbox_batch",
+    "get_bbox_width_batch",
+    "get_foot_position_batch",
+    "measure_distance_batch",
     "read_video",
+    "iter_video",
     "save_video",
+    "get_video_fps",
     "read_stub",
     "save_stub",
+    "file_cache_key",
+    "stage_cache_key",
 ]
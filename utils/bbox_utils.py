@@ -3,10 +3,13 @@ Bounding-box geometry helpers used throughout the pipeline.
 
 Every function operates on bounding boxes represented as ``(x1, y1, x2, y2)``
 where ``(x1, y1)`` is the top-left corner and ``(x2, y2)`` is the bottom-right.
+The ``*_batch`` variants apply the same computation to ``(N, 4)`` arrays.
 """
 
 import math
 
+import numpy as np
+
 
 def get_center_of_bbox(bbox):
     """Return the ``(cx, cy)`` centre point of a bounding box.
@@ -71,4 +74,102 @@ def measure_distance(p1, p2):
     float
         Euclidean distance.
     """
-    return math.sqrt((p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2)
+    return math.hypot(p1[0] - p2[0], p1[1] - p2[1])
+
+
+def measure_distance_sq(p1, p2):
+    """Compute the squared Euclidean distance between two 2-D points.
+
+    Cheaper than :func:`measure_distance` when distances are only compared
+    with each other (or with a squared threshold).
+
+    Parameters
+    ----------
+    p1, p2 : tuple[float, float]
+        ``(x, y)`` coordinates.
+
+    Returns
+    -------
+    float
+        Squared Euclidean distance.
+    """
+    dx = p1[0] - p2[0]
+    dy = p1[1] - p2[1]
+    return dx * dx + dy * dy
+
+
+# ----------------------------------------------------------------------
+# Batched variants over (N, 4) box arrays
+# ----------------------------------------------------------------------
+
+def get_center_of_bbox_batch(bboxes):
+    """Return the integer ``(cx, cy)`` centres of many bounding boxes.
+
+    Parameters
+    ----------
+    bboxes : array_like
+        ``(N, 4)`` boxes as ``(x1, y1, x2, y2)`` rows.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``(N, 2)`` int32 centres, truncated like :func:`get_center_of_bbox`.
+    """
+    bboxes = np.asarray(bboxes, dtype=np.float64).reshape(-1, 4)
+    return np.stack(
+        [(bboxes[:, 0] + bboxes[:, 2]) / 2, (bboxes[:, 1] + bboxes[:, 3]) / 2], axis=1
+    ).astype(np.int32)
+
+
+def get_bbox_width_batch(bboxes):
+    """Return the integer pixel widths of many bounding boxes.
+
+    Parameters
+    ----------
+    bboxes : array_like
+        ``(N, 4)`` boxes as ``(x1, y1, x2, y2)`` rows.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``(N,)`` int32 widths, truncated like :func:`get_bbox_width`.
+    """
+    bboxes = np.asarray(bboxes, dtype=np.float64).reshape(-1, 4)
+    return (bboxes[:, 2] - bboxes[:, 0]).astype(np.int32)
+
+
+def get_foot_position_batch(bboxes):
+    """Return the integer bottom-centre points of many bounding boxes.
+
+    Parameters
+    ----------
+    bboxes : array_like
+        ``(N, 4)`` boxes as ``(x1, y1, x2, y2)`` rows.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``(N, 2)`` int32 ``(x_centre, y_bottom)`` points, truncated like
+        :func:`get_foot_position`.
+    """
+    bboxes = np.asarray(bboxes, dtype=np.float64).reshape(-1, 4)
+    return np.stack(
+        [(bboxes[:, 0] + bboxes[:, 2]) / 2, bboxes[:, 3]], axis=1
+    ).astype(np.int32)
+
+
+def measure_distance_batch(p1, p2):
+    """Compute the Euclidean distances between matching rows of two point sets.
+
+    Parameters
+    ----------
+    p1, p2 : array_like
+        ``(N, 2)`` (or broadcastable) ``(x, y)`` coordinates.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``(N,)`` float64 distances.
+    """
+    deltas = np.asarray(p1, dtype=np.float64) - np.asarray(p2, dtype=np.float64)
+    return np.hypot(deltas[..., 0], deltas[..., 1])
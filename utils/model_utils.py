@@ -0,0 +1,202 @@
+"""
+Helpers for loading the YOLO models used by the detectors.
+
+On a CUDA machine the ``.pt`` weights are exported once to a TensorRT FP16
+engine (or, given calibration frames, an INT8 one) stored next to them, and
+later runs load that engine directly.  A failed INT8 export falls back to
+the FP16 engine; without a GPU (or when no export succeeds) the original
+weights are used.
+
+:func:`iter_predictions` runs batched inference on a background thread so the
+caller can post-process one batch while the next is being predicted.
+"""
+
+import itertools
+import logging
+import os
+import queue
+import shutil
+import tempfile
+import threading
+
+import cv2
+import torch
+from ultralytics import YOLO
+
+from configs import DETECTOR_BATCH_SIZE
+from .queue_utils import END_OF_STREAM, put_until_stopped
+from .stub_utils import file_cache_key
+
+logger = logging.getLogger(__name__)
+
+
+def load_yolo_model(model_path, batch_size=DETECTOR_BATCH_SIZE, imgsz=640, calibration_frames=None):
+    """Load a YOLO model, preferring a TensorRT engine when possible.
+
+    Parameters
+    ----------
+    model_path : str
+        Path to the model weights (``.pt``) or to an exported ``.engine``.
+    batch_size : int
+        Largest batch the engine has to accept; should match the batch size
+        used when calling ``predict``.
+    imgsz : int
+        Inference image size the engine is built for.
+    calibration_frames : Sequence[numpy.ndarray] | None
+        When given, build an INT8 engine calibrated on a sample of these
+        frames instead of the FP16 one, falling back to FP16 if that fails.
+
+    Returns
+    -------
+    YOLO
+        The loaded model.
+    """
+    if model_path.endswith(".engine"):
+        return YOLO(model_path)
+
+    # An INT8 engine that cannot be built falls back to the FP16 one
+    attempts = [(calibration_frames, True)] if calibration_frames is not None else []
+    attempts.append((None, False))
+
+    for frames, int8 in attempts:
+        engine_path = _engine_path(model_path, int8, batch_size, imgsz)
+        if os.path.exists(engine_path):
+            return YOLO(engine_path)
+        if not torch.cuda.is_available():
+            continue
+        try:
+            _export_engine(model_path, engine_path, frames, batch_size, imgsz)
+        except Exception:  # missing TensorRT, unsupported GPU, ...
+            logger.exception(
+                "TensorRT %s export of %s failed", "INT8" if int8 else "FP16", model_path
+            )
+            continue
+        return YOLO(engine_path)
+
+    return YOLO(model_path)
+
+
+def _export_engine(model_path, engine_path, calibration_frames, batch_size, imgsz):
+    """Export *model_path* to a TensorRT engine at *engine_path*.
+
+    Builds an INT8 engine calibrated on *calibration_frames* when given,
+    an FP16 one otherwise.
+    """
+    export_kwargs = dict(format="engine", dynamic=True, batch=batch_size, imgsz=imgsz)
+
+    # The export is written next to the weights as <stem>.engine, so export
+    # from a copy named after the target engine and move the result over
+    with tempfile.TemporaryDirectory() as export_dir:
+        weights_copy = os.path.join(
+            export_dir, os.path.basename(os.path.splitext(engine_path)[0]) + ".pt"
+        )
+        shutil.copy(model_path, weights_copy)
+        model = YOLO(weights_copy)
+        if calibration_frames is not None:
+            data = _write_calibration_dataset(
+                calibration_frames, model, os.path.join(export_dir, "calibration")
+            )
+            exported = model.export(int8=True, data=data, workspace=4, **export_kwargs)
+        else:
+            exported = model.export(half=True, **export_kwargs)
+        shutil.move(exported, engine_path)
+
+
+def _engine_path(model_path, int8, batch_size, imgsz):
+    """Return where the engine exported from *model_path* is cached.
+
+    The name includes a key of the weights' content and the batch size and
+    image size the engine is built for, so replacing the ``.pt`` file or
+    changing either setting builds a new engine instead of reusing one
+    TensorRT would reject.
+    """
+    stem = os.path.splitext(model_path)[0]
+    suffix = "_int8" if int8 else ""
+    return f"{stem}_{file_cache_key(model_path)[:16]}_b{batch_size}_{imgsz}{suffix}.engine"
+
+
+def _write_calibration_dataset(frames, model, directory, num_images=500):
+    """Write an evenly spaced sample of *frames* as a YOLO dataset for INT8 calibration.
+
+    The dataset carries *model*'s class names and, for pose models, the
+    keypoint layout the pose dataset loader requires.  Returns the path of
+    the dataset YAML.
+    """
+    image_dir = os.path.join(directory, "images")
+    os.makedirs(image_dir)
+
+    step = max(1, len(frames) // num_images)
+    for i, frame in enumerate(frames[::step][:num_images]):
+        cv2.imwrite(os.path.join(image_dir, f"{i:05d}.jpg"), frame)
+
+    data_path = os.path.join(directory, "calibration.yaml")
+    with open(data_path, "w") as f:
+        f.write(f"path: {directory}\ntrain: images\nval: images\nnames:\n")
+        for class_id, name in model.names.items():
+            f.write(f"  {class_id}: {name}\n")
+        model_yaml = getattr(model.model, "yaml", {})
+        for key in ("kpt_shape", "flip_idx"):
+            if key in model_yaml:
+                f.write(f"{key}: {list(model_yaml[key])}\n")
+    return data_path
+
+
+def iter_predictions(model, frames, batch_size=DETECTOR_BATCH_SIZE, prefetch=2, **predict_kwargs):
+    """Yield per-frame ``predict`` results, running inference on a worker thread.
+
+    Frames are predicted in batches of *batch_size*; at most *prefetch*
+    finished batches wait to be consumed, so the model keeps working on the
+    next batch while the caller converts and tracks the current one.
+    Inference releases the GIL, so both sides make progress.
+
+    Parameters
+    ----------
+    model : YOLO
+        The model to run.
+    frames : Iterable[numpy.ndarray]
+        Video frames to process; any iterable works, e.g. :func:`iter_video`,
+        so frames can be streamed instead of held in memory.
+    batch_size : int
+        Number of frames per ``predict`` call.
+    prefetch : int
+        Maximum number of predicted batches waiting to be consumed.
+    **predict_kwargs
+        Forwarded to ``model.predict`` (e.g. ``conf``).
+
+    Yields
+    ------
+    ultralytics.engine.results.Results
+        One result per frame, in frame order.
+    """
+    batch_queue = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+    errors = []
+
+    def predictor():
+        try:
+            frame_iter = iter(frames)
+            while not stop.is_set():
+                batch_frames = list(itertools.islice(frame_iter, batch_size))
+                if not batch_frames:
+                    break
+                batch = model.predict(batch_frames, **predict_kwargs)
+                put_until_stopped(batch_queue, batch, stop)
+        except Exception as exc:  # re-raised on the calling thread
+            errors.append(exc)
+        finally:
+            put_until_stopped(batch_queue, END_OF_STREAM, stop)
+
+    thread = threading.Thread(target=predictor, daemon=True)
+    thread.start()
+    try:
+        while True:
+            batch = batch_queue.get()
+            if batch is END_OF_STREAM:
+                break
+            yield from batch
+    finally:
+        stop.set()
+        thread.join()
+
+    if errors:
+        raise errors[0]
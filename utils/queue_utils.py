@@ -0,0 +1,28 @@
+"""
+Helpers shared by the background-thread producers in :mod:`utils.video_utils`
+and :mod:`utils.model_utils`.
+
+A producer puts its items on a bounded :class:`queue.Queue` with
+:func:`put_until_stopped` and finishes with :data:`END_OF_STREAM`; the
+consumer sets the ``stop`` event when it quits early so the producer never
+blocks on a full queue.
+"""
+
+import queue
+
+# Marks the end of a producer's queue
+END_OF_STREAM = object()
+
+
+def put_until_stopped(item_queue, item, stop):
+    """Put *item* on *item_queue* unless *stop* is set first.
+
+    Returns ``True`` if the item was queued.
+    """
+    while not stop.is_set():
+        try:
+            item_queue.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
@@ -5,6 +5,7 @@ Heavy detection and tracking steps can be cached to disk so that subsequent
 runs skip the expensive inference and read pre-computed results instead.
 """
 
+import hashlib
 import pickle
 import os
 
@@ -24,12 +25,14 @@ def read_stub(read_from_stub, stub_path):
     object | None
         The unpickled object, or ``None`` if the cache was not read.
     """
-    if not read_from_stub:
-        return None
-    if stub_path is None or not os.path.exists(stub_path):
+    if not read_from_stub or stub_path is None:
         return None
 
-    with open(stub_path, "rb") as f:
+    try:
+        f = open(stub_path, "rb")
+    except FileNotFoundError:
+        return None
+    with f:
         return pickle.load(f)
 
 
@@ -48,6 +51,59 @@ def save_stub(stub_path, data):
     if stub_path is None:
         return
 
-    os.makedirs(os.path.dirname(stub_path), exist_ok=True)
+    parent = os.path.dirname(stub_path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
     with open(stub_path, "wb") as f:
-        pickle.dump(data, f)
+        # Protocol 5 writes the buffers of numpy arrays (packed stubs) directly
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def file_cache_key(path, head_bytes=1_000_000):
+    """Return a short content key identifying a file (a video or model weights).
+
+    The key hashes the first *head_bytes* of the file together with its total
+    size, which is enough to tell files apart without reading them whole.
+
+    Parameters
+    ----------
+    path : str
+        Path to the file.
+    head_bytes : int
+        Number of leading bytes to hash.
+
+    Returns
+    -------
+    str
+        Hex digest of the file head and size.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        digest.update(f.read(head_bytes))
+    digest.update(str(os.path.getsize(path)).encode())
+    return digest.hexdigest()
+
+
+def stage_cache_key(*parts):
+    """Combine everything a pipeline stage depends on into one short key.
+
+    Pass the keys of the stage's upstream inputs (e.g. :func:`file_cache_key`
+    of the video and model, or another stage's key) together with the
+    configuration values that change its output.  Putting the result in the
+    stub file name means a stub is only reused when all of them match.
+
+    Parameters
+    ----------
+    *parts : object
+        Keys and configuration values; each is hashed through its ``repr``.
+
+    Returns
+    -------
+    str
+        Hex digest of the parts.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(repr(part).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
@@ -1,14 +1,45 @@
 """
 Video I/O helpers wrapping OpenCV's :pyclass:`cv2.VideoCapture` and
 :pyclass:`cv2.VideoWriter`.
+
+Besides the batch :func:`read_video`, frames can be streamed with
+:func:`iter_video`, which decodes on a background thread.  :func:`save_video`
+encodes on a background thread as well, so decode, drawing and encode
+overlap when the two are chained.  Decoding asks FFmpeg for any available
+hardware decoder and silently falls back to its (multi-threaded) software
+decoder.
 """
 
+import os
+import queue
+import threading
+
 import cv2
+import numpy as np
+
+from .queue_utils import END_OF_STREAM, put_until_stopped
+
+# Hardware H.264 encode through NVIDIA's GStreamer plugin (MP4 output only)
+_GSTREAMER_NVENC_PIPELINE = (
+    'appsrc ! videoconvert ! nvh264enc ! h264parse ! mp4mux ! filesink location="{path}"'
+)
+
+# Software fallbacks keyed by container extension
+_FALLBACK_FOURCC = {".mp4": "mp4v", ".avi": "XVID"}
+
+# Used when a container does not report its frame-rate
+_DEFAULT_FPS = 24
 
 
 def read_video(video_path):
     """Read every frame from a video file into a list.
 
+    Frames are decoded straight into one preallocated ``(N, H, W, 3)`` buffer
+    sized from the container's frame count, and the returned list holds
+    views into it, so reading a video costs a single allocation instead of
+    one per frame.  The buffer grows (and is trimmed to the frames read) if
+    the container under-reports its length.
+
     Parameters
     ----------
     video_path : str
@@ -19,32 +50,219 @@ def read_video(video_path):
     list[numpy.ndarray]
         BGR frames in the order they appear in the video.
     """
-    cap = cv2.VideoCapture(video_path)
-    frames = []
+    cap = _open_video_capture(video_path)
+    frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    if width <= 0 or height <= 0:
+        # Unknown geometry: fall back to one allocation per frame
+        frames = []
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frames.append(frame)
+        cap.release()
+        return frames
+
+    buffer = np.empty((max(frame_count, 1), height, width, 3), dtype=np.uint8)
+    n = 0
+    grew = False
     while True:
-        ret, frame = cap.read()
+        if n < len(buffer):
+            ret, frame = cap.read(buffer[n])
+        else:
+            # Full: only grow once a frame past the reported count really exists
+            ret, frame = cap.read()
         if not ret:
             break
-        frames.append(frame)
+        if n == len(buffer):
+            grown = np.empty((2 * len(buffer),) + buffer.shape[1:], dtype=np.uint8)
+            grown[:n] = buffer
+            buffer = grown
+            grew = True
+        if not np.shares_memory(frame, buffer):
+            # The backend handed back its own array (e.g. a different size)
+            buffer[n] = frame
+        n += 1
+    cap.release()
+    if grew:
+        # Don't let the views keep the unused half of the grown buffer alive
+        buffer = buffer[:n].copy()
+    return list(buffer[:n])
+
+
+def get_video_fps(video_path):
+    """Return the frame-rate of a video file.
+
+    Parameters
+    ----------
+    video_path : str
+        Path to the video file.
+
+    Returns
+    -------
+    float
+        Frames per second, or 24 if the container does not report it.
+    """
+    cap = cv2.VideoCapture(video_path)
+    fps = cap.get(cv2.CAP_PROP_FPS)
     cap.release()
-    return frames
+    return fps if fps > 0 else _DEFAULT_FPS
+
+
+def iter_video(video_path, prefetch=8):
+    """Yield the frames of a video file, decoding them on a reader thread.
+
+    At most ``prefetch`` decoded frames are buffered, so memory stays bounded
+    regardless of the video length.
 
+    Parameters
+    ----------
+    video_path : str
+        Path to the input video file.
+    prefetch : int
+        Maximum number of decoded frames waiting to be consumed.
+
+    Yields
+    ------
+    numpy.ndarray
+        BGR frames in the order they appear in the video.
+    """
+    frame_queue = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def reader():
+        cap = _open_video_capture(video_path)
+        try:
+            while not stop.is_set():
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                put_until_stopped(frame_queue, frame, stop)
+        finally:
+            cap.release()
+            put_until_stopped(frame_queue, END_OF_STREAM, stop)
+
+    thread = threading.Thread(target=reader, daemon=True)
+    thread.start()
+    try:
+        while True:
+            frame = frame_queue.get()
+            if frame is END_OF_STREAM:
+                break
+            yield frame
+    finally:
+        stop.set()
+        thread.join()
 
-def save_video(output_video_frames, output_video_path):
-    """Write a list of frames to an AVI video file.
 
-    The codec is set to XVID and the frame-rate defaults to 24 fps.
+def save_video(output_video_frames, output_video_path, fps=_DEFAULT_FPS, prefetch=8):
+    """Write frames to a video file.
+
+    MP4 output is encoded as H.264 on the GPU when OpenCV was built with
+    GStreamer and the ``nvh264enc`` element is available; otherwise (and for
+    other containers) a codec is chosen from the file extension (``mp4v`` for
+    ``.mp4``, XVID for ``.avi``) and FFmpeg is asked to use a hardware encoder
+    for it if one exists.  Frames may be any iterable (e.g. a generator of
+    annotated frames); encoding runs on a writer thread fed through a queue
+    of at most ``prefetch`` frames.
 
     Parameters
     ----------
-    output_video_frames : list[numpy.ndarray]
+    output_video_frames : Iterable[numpy.ndarray]
         BGR frames to write.
     output_video_path : str
         Destination file path.
+    fps : float
+        Output frame-rate; pass :func:`get_video_fps` of the source to keep
+        its timing.
+    prefetch : int
+        Maximum number of frames waiting to be encoded.
     """
-    fourcc = cv2.VideoWriter_fourcc(*"XVID")
-    height, width = output_video_frames[0].shape[:2]
-    out = cv2.VideoWriter(output_video_path, fourcc, 24, (width, height))
-    for frame in output_video_frames:
-        out.write(frame)
+    frames = iter(output_video_frames)
+    first_frame = next(frames, None)
+    if first_frame is None:
+        return
+
+    height, width = first_frame.shape[:2]
+    out = _open_video_writer(output_video_path, fps, (width, height))
+
+    frame_queue = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+    errors = []
+
+    def writer():
+        try:
+            while True:
+                frame = frame_queue.get()
+                if frame is END_OF_STREAM:
+                    break
+                out.write(frame)
+        except Exception as exc:  # re-raised on the calling thread
+            errors.append(exc)
+            stop.set()
+
+    thread = threading.Thread(target=writer, daemon=True)
+    thread.start()
+    try:
+        put_until_stopped(frame_queue, first_frame, stop)
+        for frame in frames:
+            if not put_until_stopped(frame_queue, frame, stop):
+                break
+    finally:
+        put_until_stopped(frame_queue, END_OF_STREAM, stop)
+        thread.join()
+        out.release()
+
+    if errors:
+        raise errors[0]
+
+
+def _open_video_capture(video_path):
+    """Open a :pyclass:`cv2.VideoCapture`, preferring hardware-accelerated decode."""
+    cap = cv2.VideoCapture(
+        video_path,
+        cv2.CAP_FFMPEG,
+        [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+    )
+    if cap.isOpened():
+        return cap
+    cap.release()
+    return cv2.VideoCapture(video_path)
+
+
+def _open_video_writer(output_video_path, fps, frame_size):
+    """Open a :pyclass:`cv2.VideoWriter`, preferring hardware H.264 for MP4."""
+    extension = os.path.splitext(output_video_path)[1].lower()
+
+    if extension == ".mp4" and _has_gstreamer():
+        # Quoted in the pipeline so paths with spaces survive parsing
+        escaped_path = output_video_path.replace("\\", "\\\\").replace('"', '\\"')
+        pipeline = _GSTREAMER_NVENC_PIPELINE.format(path=escaped_path)
+        out = cv2.VideoWriter(pipeline, cv2.CAP_GSTREAMER, 0, fps, frame_size, True)
+        if out.isOpened():
+            return out
+        out.release()
+
+    fourcc = cv2.VideoWriter_fourcc(*_FALLBACK_FOURCC.get(extension, "XVID"))
+    out = cv2.VideoWriter(
+        output_video_path,
+        cv2.CAP_FFMPEG,
+        fourcc,
+        fps,
+        frame_size,
+        [cv2.VIDEOWRITER_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+    )
+    if out.isOpened():
+        return out
     out.release()
+    return cv2.VideoWriter(output_video_path, fourcc, fps, frame_size)
+
+
+def _has_gstreamer():
+    """Return ``True`` if this OpenCV build includes the GStreamer backend."""
+    for line in cv2.getBuildInformation().splitlines():
+        if "GStreamer" in line:
+            return "YES" in line
+    return False